@@ -1,3 +1,4 @@
+from array import array
 from collections import deque
 import heapq
 
@@ -154,6 +155,224 @@ class Graf:
             print(f"Polaczenie: {u} - {v} (Koszt): {k})")
         print(f"Calkowity koszt budowy sieci: {calkowity_koszt}")
 
+    def do_csr(self):
+        return GrafCSR.z_grafu(self)
+
+
+class GrafCSR:
+    """
+    Zwarta reprezentacja grafu (CSR): wierzcholki to liczby 0..n-1,
+    sasiedzi wierzcholka i to cele[offsety[i]:offsety[i + 1]] z wagami
+    w wagi[...]. Etykiety sa mapowane na indeksy (etykiety / indeks).
+    Osobno trzymana jest lista krawedzi (jak lista_krawedzi w Graf) dla Kruskala.
+    Wagi sa calkowite ('q'); jesli choc jedna jest float, wszystkie sa 'd'.
+    """
+
+    def __init__(self):
+        self.etykiety = []
+        self.indeks = {}
+        self.offsety = array('q', [0])
+        self.cele = array('q')
+        self.wagi = array('q')
+        self.kraw_zrodla = array('q')
+        self.kraw_cele = array('q')
+        self.kraw_wagi = array('q')
+
+    def _id(self, etykieta):
+        i = self.indeks.get(etykieta)
+        if i is None:
+            i = self.indeks[etykieta] = len(self.etykiety)
+            self.etykiety.append(etykieta)
+        return i
+
+    @staticmethod
+    def _dopisz_wage(tablica, koszt):
+        # Tablica calkowita zamieniana na zmiennoprzecinkowa przy pierwszym floacie
+        if tablica.typecode == 'q' and not isinstance(koszt, int):
+            tablica = array('d', tablica)
+        tablica.append(koszt)
+        return tablica
+
+    def _zbuduj(self, luki):
+        # Sortowanie przez zliczanie po zrodle - zachowuje kolejnosc sasiadow
+        zrodla = array('q')
+        cele = array('q')
+        wagi = array('q')
+        for u, v, koszt in luki:
+            zrodla.append(u)
+            cele.append(v)
+            wagi = self._dopisz_wage(wagi, koszt)
+
+        n = len(self.etykiety)
+        licznik = [0] * (n + 1)
+        for u in zrodla:
+            licznik[u + 1] += 1
+        for i in range(n):
+            licznik[i + 1] += licznik[i]
+        self.offsety = array('q', licznik)
+
+        pozycja = licznik[:-1]
+        self.cele = array('q', bytes(8 * len(cele)))
+        self.wagi = array(wagi.typecode, bytes(8 * len(wagi)))
+        for u, v, koszt in zip(zrodla, cele, wagi):
+            self.cele[pozycja[u]] = v
+            self.wagi[pozycja[u]] = koszt
+            pozycja[u] += 1
+
+    @classmethod
+    def z_krawedzi(cls, krawedzie, skierowany=False):
+        """
+        Buduje graf z krotek (zrodlo, cel, koszt) bez tworzenia obiektow
+        Wierzcholek - pamiec O(n + m) w tablicach.
+        """
+        graf = cls()
+
+        def luki():
+            for zrodlo, cel, koszt in krawedzie:
+                u, v = graf._id(zrodlo), graf._id(cel)
+                graf.kraw_zrodla.append(u)
+                graf.kraw_cele.append(v)
+                graf.kraw_wagi = graf._dopisz_wage(graf.kraw_wagi, koszt)
+                yield u, v, koszt
+                if not skierowany:
+                    yield v, u, koszt
+
+        graf._zbuduj(luki())
+        return graf
+
+    @classmethod
+    def z_grafu(cls, graf_obiektowy):
+        graf = cls()
+        for wartosc in graf_obiektowy.wierzcholki:
+            graf._id(wartosc)
+        for koszt, u, v in graf_obiektowy.lista_krawedzi:
+            graf.kraw_zrodla.append(graf.indeks[u.wartosc])
+            graf.kraw_cele.append(graf.indeks[v.wartosc])
+            graf.kraw_wagi = graf._dopisz_wage(graf.kraw_wagi, koszt)
+        graf._zbuduj(
+            (graf.indeks[w.wartosc], graf.indeks[s.wartosc], w.wagi[s])
+            for w in graf_obiektowy.wierzcholki.values()
+            for s in w.sasiedzi
+        )
+        return graf
+
+    def sasiedzi(self, i):
+        return self.cele[self.offsety[i]:self.offsety[i + 1]]
+
+    def bfs(self, start_wartosc, wypisz=True):
+        if start_wartosc not in self.indeks: return
+        start = self.indeks[start_wartosc]
+        offsety, cele = self.offsety, self.cele
+        odwiedzone = bytearray(len(self.etykiety))
+        odwiedzone[start] = 1
+        kolejka = deque([start])
+        wynik = []
+        while kolejka:
+            obecny = kolejka.popleft()
+            wynik.append(obecny)
+            for k in range(offsety[obecny], offsety[obecny + 1]):
+                sasiad = cele[k]
+                if not odwiedzone[sasiad]:
+                    odwiedzone[sasiad] = 1
+                    kolejka.append(sasiad)
+        wynik = [self.etykiety[i] for i in wynik]
+        if wypisz:
+            print(f"BFS: {wynik}")
+        return wynik
+
+    def dfs(self, start_wartosc, wypisz=True):
+        # Iteracyjnie (bez limitu rekurencji), ta sama kolejnosc co wersja rekurencyjna
+        if start_wartosc not in self.indeks: return
+        start = self.indeks[start_wartosc]
+        offsety, cele = self.offsety, self.cele
+        odwiedzone = bytearray(len(self.etykiety))
+        odwiedzone[start] = 1
+        wynik = [start]
+        stos = [(start, offsety[start])]
+        while stos:
+            wezel, k = stos[-1]
+            if k == offsety[wezel + 1]:
+                stos.pop()
+                continue
+            stos[-1] = (wezel, k + 1)
+            sasiad = cele[k]
+            if not odwiedzone[sasiad]:
+                odwiedzone[sasiad] = 1
+                wynik.append(sasiad)
+                stos.append((sasiad, offsety[sasiad]))
+        wynik = [self.etykiety[i] for i in wynik]
+        if wypisz:
+            print(f"DFS: {wynik}")
+        return wynik
+
+    def kruskal_mst(self, wypisz=True):
+        n = len(self.etykiety)
+        rodzic = list(range(n))
+        ranga = bytearray(n)
+
+        def find(x):
+            while rodzic[x] != x:
+                rodzic[x] = rodzic[rodzic[x]]
+                x = rodzic[x]
+            return x
+
+        mst = []
+        calkowity_koszt = 0
+        kolejnosc = sorted(range(len(self.kraw_wagi)), key=self.kraw_wagi.__getitem__)
+
+        if wypisz: print("--- Przebieg algorytmu Kruskala ---")
+        for e in kolejnosc:
+            u, v, koszt = self.kraw_zrodla[e], self.kraw_cele[e], self.kraw_wagi[e]
+            root_u, root_v = find(u), find(v)
+            nazwa_u, nazwa_v = self.etykiety[u], self.etykiety[v]
+            if root_u != root_v:
+                if ranga[root_u] < ranga[root_v]:
+                    root_u, root_v = root_v, root_u
+                rodzic[root_v] = root_u
+                if ranga[root_u] == ranga[root_v]:
+                    ranga[root_u] += 1
+                if wypisz: print(f"Dodano most: {nazwa_u}-{nazwa_v} (koszt: {koszt})")
+                mst.append((nazwa_u, nazwa_v, koszt))
+                calkowity_koszt += koszt
+            elif wypisz:
+                print(f"Pominieto most: {nazwa_u}-{nazwa_v} (koszt: {koszt}) - utworzylby cykl")
+
+        if wypisz: print(f"\nCalkowity koszt minimalnego drzewa (MST): {calkowity_koszt}")
+        return mst, calkowity_koszt
+
+    def algorytm_prima(self, start_wartosc, wypisz=True):
+        if start_wartosc not in self.indeks:
+            print("Wierzcholek startowy nie istnieje.")
+            return
+
+        start = self.indeks[start_wartosc]
+        offsety, cele, wagi = self.offsety, self.cele, self.wagi
+        min_heap = [(0, start, start)]
+        odwiedzone = bytearray(len(self.etykiety))
+        mst_krawedzie = []
+        calkowity_koszt = 0
+
+        while min_heap:
+            koszt, u, v = heapq.heappop(min_heap)
+            if odwiedzone[v]:
+                continue
+            odwiedzone[v] = 1
+            if u != v:
+                calkowity_koszt += koszt
+                mst_krawedzie.append((self.etykiety[u], self.etykiety[v], koszt))
+            for k in range(offsety[v], offsety[v + 1]):
+                sasiad = cele[k]
+                if not odwiedzone[sasiad]:
+                    heapq.heappush(min_heap, (wagi[k], v, sasiad))
+
+        if wypisz:
+            print(f"--- Algorytm Prima (Start: {start_wartosc}) ---")
+            print("Minimalne Drzewo Rozpinajace (MST) wg Prima:")
+            for u, v, k in mst_krawedzie:
+                print(f"Polaczenie: {u} - {v} (Koszt): {k})")
+            print(f"Calkowity koszt budowy sieci: {calkowity_koszt}")
+        return mst_krawedzie, calkowity_koszt
+
 
 if __name__ == "__main__":
     g = Graf()
@@ -189,5 +408,9 @@ if __name__ == "__main__":
     print("\n--- Zad 3 ---")
     g2.algorytm_prima("A")
 
-
-
+    print("\n--- Reprezentacja CSR ---")
+    g_csr = g.do_csr()
+    g_csr.bfs("A")
+    g_csr.dfs("A")
+    g_csr.kruskal_mst()
+    GrafCSR.z_krawedzi(polaczenia).algorytm_prima("A")
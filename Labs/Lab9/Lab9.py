@@ -1,16 +1,551 @@
+import hashlib
+import os
+import pickle
+import random
 import time
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import islice
+from multiprocessing import shared_memory
+
+
+class AhoCorasick:
+    """
+    Automat Aho-Corasick dla wielu wzorców jednocześnie.
+    Budowany raz, potem jeden przebieg po tekście: O(n + liczba dopasowań).
+    """
+
+    def __init__(self, patterns):
+        self.patterns = list(dict.fromkeys(p.lower() for p in patterns if p))
+        self.goto = [{}]
+        self.fail = [0]
+        self.out = [[]]
+
+        # Budowanie drzewa trie
+        for idx, pattern in enumerate(self.patterns):
+            state = 0
+            for ch in pattern:
+                nxt = self.goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(self.goto)
+                    self.goto[state][ch] = nxt
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.out.append([])
+                state = nxt
+            self.out[state].append(idx)
+
+        # Funkcja porażki (BFS po stanach)
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self.goto[state].items():
+                queue.append(nxt)
+                f = self.fail[state]
+                while f and ch not in self.goto[f]:
+                    f = self.fail[f]
+                self.fail[nxt] = self.goto[f].get(ch, 0)
+                self.out[nxt] = self.out[nxt] + self.out[self.fail[nxt]]
+
+    def search(self, text):
+        """
+        Zwraca słownik {wzorzec: (liczba wystąpień, lista pozycji)}.
+        """
+        positions = [[] for _ in self.patterns]
+        goto, fail, out = self.goto, self.fail, self.out
+        lengths = [len(p) for p in self.patterns]
+        state = 0
+        for i, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for idx in out[state]:
+                positions[idx].append(i - lengths[idx] + 1)
+        return {p: (len(positions[idx]), positions[idx]) for idx, p in enumerate(self.patterns)}
+
+
+class SuffixArrayIndex:
+    """
+    Tablica sufiksów z tablicą LCP zbudowana raz dla całego tekstu.
+    Zapytanie o wzorzec kosztuje O(m log n) zamiast O(n).
+    """
+
+    def __init__(self, text, sa=None, lcp=None):
+        self.text = text
+        self.n = len(text)
+        typecode = "i" if self.n < 2 ** 31 else "q"
+        self.sa = sa if sa is not None else array(typecode, self._build_sa(text))
+        self.lcp = lcp if lcp is not None else array(typecode, self._build_lcp(text, self.sa))
+
+    @staticmethod
+    def _build_sa(text):
+        # Podwajanie prefiksów: sortowanie po parach (rank[i], rank[i + k])
+        n = len(text)
+        sa = list(range(n))
+        rank = [ord(c) for c in text]
+        k = 1
+        while n > 1:
+            base = max(rank) + 2
+            keys = [rank[i] * base + (rank[i + k] + 1 if i + k < n else 0) for i in range(n)]
+            sa.sort(key=keys.__getitem__)
+            rank = [0] * n
+            for j in range(1, n):
+                rank[sa[j]] = rank[sa[j - 1]] + (keys[sa[j]] != keys[sa[j - 1]])
+            if rank[sa[-1]] == n - 1:
+                break
+            k <<= 1
+        return sa
+
+    @staticmethod
+    def _build_lcp(text, sa):
+        # Algorytm Kasai: lcp[i] = wspólny prefiks sa[i - 1] i sa[i]
+        n = len(text)
+        rank = [0] * n
+        for i, pos in enumerate(sa):
+            rank[pos] = i
+        lcp = [0] * n
+        h = 0
+        for i in range(n):
+            if rank[i] > 0:
+                j = sa[rank[i] - 1]
+                while i + h < n and j + h < n and text[i + h] == text[j + h]:
+                    h += 1
+                lcp[rank[i]] = h
+                if h > 0:
+                    h -= 1
+            else:
+                h = 0
+        return lcp
+
+    def _bounds(self, pattern):
+        m = len(pattern)
+        text, sa = self.text, self.sa
+        lo, hi = 0, self.n
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if text[sa[mid]: sa[mid] + m] < pattern:
+                lo = mid + 1
+            else:
+                hi = mid
+        first = lo
+        hi = self.n
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if text[sa[mid]: sa[mid] + m] <= pattern:
+                lo = mid + 1
+            else:
+                hi = mid
+        return first, lo
+
+    def count(self, pattern):
+        first, last = self._bounds(pattern)
+        return last - first
+
+    def find(self, pattern):
+        """
+        Zwraca (liczba wystąpień, posortowana lista pozycji).
+        """
+        first, last = self._bounds(pattern)
+        return last - first, sorted(self.sa[first:last])
+
+    def longest_repeat(self):
+        # Najdłuższy powtarzający się podciąg - maksimum tablicy LCP
+        if self.n < 2:
+            return ""
+        best = max(range(self.n), key=self.lcp.__getitem__)
+        return self.text[self.sa[best]: self.sa[best] + self.lcp[best]]
+
+    def save(self, path):
+        data = {
+            "n": self.n,
+            "checksum": hashlib.sha1(self.text.encode("utf-8")).hexdigest(),
+            "sa": self.sa,
+            "lcp": self.lcp,
+        }
+        with open(path, "wb") as f:
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls, path, text):
+        """
+        Wczytuje indeks z dysku. Tekst musi być ten sam, dla którego
+        indeks zbudowano (sprawdzana jest długość i suma kontrolna).
+        """
+        with open(path, "rb") as f:
+            data = pickle.load(f)
+        if data["n"] != len(text) or data["checksum"] != hashlib.sha1(text.encode("utf-8")).hexdigest():
+            raise ValueError(f"Indeks '{path}' nie pasuje do podanego tekstu")
+        return cls(text, data["sa"], data["lcp"])
+
+
+class RollingHashSearch:
+    """
+    Rabin-Karp z 61-bitowym modułem (liczba pierwsza Mersenne'a) dla zbioru
+    wzorców tej samej długości. Jeden przebieg po tekście, okno porównywane
+    ze zbiorem haszy; statystyki pokazują ile trafień było fałszywych.
+    """
+    MOD = (1 << 61) - 1
+
+    def __init__(self, patterns, base=None):
+        self.patterns = list(dict.fromkeys(p.lower() for p in patterns))
+        lengths = {len(p) for p in self.patterns}
+        if len(lengths) != 1 or 0 in lengths:
+            raise ValueError("Wszystkie wzorce muszą być niepuste i tej samej długości")
+        self.m = lengths.pop()
+        # Losowa podstawa utrudnia dobranie danych wywołujących kolizje
+        self.base = base if base is not None else random.randrange(1 << 20, self.MOD - 1)
+        self.h = pow(self.base, self.m - 1, self.MOD)
+        self.hashes = {}
+        for p in self.patterns:
+            self.hashes.setdefault(self._hash(p), []).append(p)
+
+    def _hash(self, s):
+        value = 0
+        for ch in s:
+            value = (value * self.base + ord(ch)) % self.MOD
+        return value
+
+    def search(self, text):
+        """
+        Zwraca (wyniki, statystyki), gdzie wyniki to słownik
+        {wzorzec: (liczba wystąpień, lista pozycji)}.
+        """
+        positions = {p: [] for p in self.patterns}
+        stats = {"windows": 0, "hash_hits": 0, "spurious_hits": 0}
+        n, m = len(text), self.m
+        if n < m:
+            return {p: (0, []) for p in self.patterns}, stats
+
+        mod, base, h, hashes = self.MOD, self.base, self.h, self.hashes
+        t = self._hash(text[:m])
+        for i in range(n - m + 1):
+            candidates = hashes.get(t)
+            if candidates is not None:
+                stats["hash_hits"] += 1
+                window = text[i: i + m]
+                for p in candidates:
+                    if p == window:
+                        positions[p].append(i)
+                        break
+                else:
+                    stats["spurious_hits"] += 1
+            if i < n - m:
+                t = ((t - ord(text[i]) * h) * base + ord(text[i + m])) % mod
+        stats["windows"] = n - m + 1
+        return {p: (len(pos), pos) for p, pos in positions.items()}, stats
+
+
+# Tablice Boyera-Moore'a liczone raz dla danego wzorca (str lub bytes)
+
+@lru_cache(maxsize=256)
+def _last_occurrence(pattern):
+    """
+    Reguła złego znaku: ostatnia pozycja znaku we wzorcu.
+    Dla bytes - lista 256 elementów, dla str - słownik.
+    """
+    if isinstance(pattern, bytes):
+        table = [-1] * 256
+        for i, b in enumerate(pattern):
+            table[b] = i
+        return table
+    return {pattern[i]: i for i in range(len(pattern))}
+
+
+@lru_cache(maxsize=256)
+def _good_suffix_shifts(pattern):
+    """
+    Reguła dobrego sufiksu (wersja silna): shift[j] to przesunięcie
+    po niezgodności na pozycji j - 1; shift[0] po pełnym dopasowaniu.
+    """
+    m = len(pattern)
+    shift = [0] * (m + 1)
+    border = [0] * (m + 1)
+    i, j = m, m + 1
+    border[i] = j
+    while i > 0:
+        while j <= m and pattern[i - 1] != pattern[j - 1]:
+            if shift[j] == 0:
+                shift[j] = j - i
+            j = border[j]
+        i -= 1
+        j -= 1
+        border[i] = j
+    j = border[0]
+    for i in range(m + 1):
+        if shift[i] == 0:
+            shift[i] = j
+        if i == j:
+            j = border[j]
+    return shift
+
+
+@lru_cache(maxsize=256)
+def _horspool_shifts(pattern):
+    m = len(pattern)
+    if isinstance(pattern, bytes):
+        table = [m] * 256
+    else:
+        table = {}
+    for i in range(m - 1):
+        table[pattern[i]] = m - 1 - i
+    return table
+
+
+# Generatory pozycji dopasowań - wspólny rdzeń metod search_*
+# Przeszukują tylko text[start:end] bez kopiowania tego fragmentu.
+
+def _clip(text, start, end):
+    n = len(text) if end is None else max(0, min(end, len(text)))
+    return max(start, 0), n
+
+
+def _iter_naive(text, pattern, start=0, end=None):
+    start, n = _clip(text, start, end)
+    m = len(pattern)
+    for i in range(start, n - m + 1):
+        if text[i: i + m] == pattern:
+            yield i
+
+
+def _iter_rabin_karp(text, pattern, start=0, end=None):
+    start, n = _clip(text, start, end)
+    m = len(pattern)
+    if n - start < m:
+        return
+    # Dla bytes elementy to już liczby
+    code = ord if isinstance(text, str) else int
+    d = 256;
+    q = RollingHashSearch.MOD
+    p = 0;
+    t = 0;
+    h = 1
+
+    for i in range(m - 1):
+        h = (h * d) % q
+
+    for i in range(m):
+        p = (d * p + code(pattern[i])) % q
+        t = (d * t + code(text[start + i])) % q
+
+    for i in range(start, n - m + 1):
+        if p == t:
+            if text[i: i + m] == pattern:
+                yield i
+        if i < n - m:
+            t = (d * (t - code(text[i]) * h) + code(text[i + m])) % q
+            if t < 0: t += q
+
+
+def _iter_kmp(text, pattern, start=0, end=None):
+    start, n = _clip(text, start, end)
+    m = len(pattern)
+    # Budowanie tablicy LPS
+    lps = [0] * m
+    length = 0;
+    i = 1
+    while i < m:
+        if pattern[i] == pattern[length]:
+            length += 1;
+            lps[i] = length;
+            i += 1
+        else:
+            if length != 0:
+                length = lps[length - 1]
+            else:
+                lps[i] = 0; i += 1
+
+    # Wyszukiwanie
+    i = start;
+    j = 0
+    while i < n:
+        if pattern[j] == text[i]:
+            i += 1;
+            j += 1
+        if j == m:
+            yield i - m
+            j = lps[j - 1]
+        elif i < n and pattern[j] != text[i]:
+            if j != 0:
+                j = lps[j - 1]
+            else:
+                i += 1
+
+
+def _iter_boyer_moore(text, pattern, start=0, end=None):
+    start, n = _clip(text, start, end)
+    m = len(pattern)
+    last = _last_occurrence(pattern)
+    bad = last.__getitem__ if isinstance(last, list) else (lambda c: last.get(c, -1))
+    s = start
+    while s <= n - m:
+        j = m - 1
+        while j >= 0 and pattern[j] == text[s + j]:
+            j -= 1
+        if j < 0:
+            yield s
+            s += (m - bad(text[s + m]) if s + m < n else 1)
+        else:
+            s += max(1, j - bad(text[s + j]))
+
+
+def _iter_boyer_moore_full(text, pattern, start=0, end=None):
+    start, n = _clip(text, start, end)
+    m = len(pattern)
+    last = _last_occurrence(pattern)
+    shift = _good_suffix_shifts(pattern)
+    bad = last.__getitem__ if isinstance(last, list) else (lambda c: last.get(c, -1))
+    s = start
+    while s <= n - m:
+        j = m - 1
+        while j >= 0 and pattern[j] == text[s + j]:
+            j -= 1
+        if j < 0:
+            yield s
+            s += shift[0]
+        else:
+            s += max(shift[j + 1], j - bad(text[s + j]))
+
+
+def _iter_horspool(text, pattern, start=0, end=None):
+    start, n = _clip(text, start, end)
+    m = len(pattern)
+    table = _horspool_shifts(pattern)
+    shift = table.__getitem__ if isinstance(table, list) else (lambda c: table.get(c, m))
+    last = pattern[-1]
+    s = start
+    while s <= n - m:
+        c = text[s + m - 1]
+        if c == last and text[s: s + m] == pattern:
+            yield s
+        s += shift(c)
+
+
+class WildcardPattern:
+    """
+    Skompilowany wzorzec z '?' (dowolny znak) i '*' (dowolny ciąg).
+    Zamiast tablicy DP (n+1)x(m+1) używa zachłannego dopasowania z
+    powrotem do ostatniej gwiazdki - dodatkowa pamięć O(1).
+    """
+
+    def __init__(self, pattern):
+        # Kolejne gwiazdki są równoważne jednej
+        collapsed = []
+        for ch in pattern:
+            if ch != '*' or not collapsed or collapsed[-1] != '*':
+                collapsed.append(ch)
+        self.pattern = "".join(collapsed)
+        # Bez '?' dopasowanie sprowadza się do szukania stałych kawałków
+        self.segments = self.pattern.split('*') if '?' not in self.pattern else None
+
+    def match(self, text):
+        if self.segments is not None:
+            return self._match_segments(text)
+        p, m, n = self.pattern, len(self.pattern), len(text)
+        i = j = 0
+        star, mark = -1, 0
+        while i < n:
+            if j < m and (p[j] == '?' or p[j] == text[i]):
+                i += 1
+                j += 1
+            elif j < m and p[j] == '*':
+                star, mark = j, i
+                j += 1
+            elif star != -1:
+                j = star + 1
+                mark += 1
+                i = mark
+            else:
+                return False
+        while j < m and p[j] == '*':
+            j += 1
+        return j == m
+
+    def _match_segments(self, text):
+        segments = self.segments
+        if len(segments) == 1:
+            return text == segments[0]
+        first, last = segments[0], segments[-1]
+        if len(first) + len(last) > len(text) or not text.startswith(first) or not text.endswith(last):
+            return False
+        pos, end = len(first), len(text) - len(last)
+        for segment in segments[1:-1]:
+            pos = text.find(segment, pos, end)
+            if pos < 0:
+                return False
+            pos += len(segment)
+        return True
+
+    def filter(self, texts):
+        """
+        Zwraca generator tekstów pasujących do wzorca (np. ścieżek plików).
+        """
+        match = self.match
+        return (text for text in texts if match(text))
+
+
+@lru_cache(maxsize=256)
+def compile_wildcard(pattern):
+    return WildcardPattern(pattern)
+
+
+def _grid_rows(grid):
+    # Każdy wiersz jako str - szybkie indeksowanie niezależnie od formatu wejścia
+    if hasattr(grid, "tolist"):
+        grid = grid.tolist()
+    rows = []
+    for row in grid:
+        if isinstance(row, (bytes, bytearray)):
+            row = row.decode("utf-8")
+        elif not isinstance(row, str):
+            row = "".join(ch.decode("utf-8") if isinstance(ch, bytes) else str(ch) for ch in row)
+        rows.append(row)
+    return rows
+
+
+_MATCHERS = {
+    "naive": _iter_naive,
+    "kmp": _iter_kmp,
+    "rabin_karp": _iter_rabin_karp,
+    "boyer_moore": _iter_boyer_moore,
+    "boyer_moore_full": _iter_boyer_moore_full,
+    "horspool": _iter_horspool,
+}
+
+
+def _search_shard(shm_name, encoding, width, start, end, stop, method, pattern):
+    """
+    Proces roboczy: dołącza do pamięci współdzielonej, dekoduje fragment
+    [start, stop) i zwraca pozycje dopasowań zaczynających się przed end.
+    """
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        shard = bytes(shm.buf[start * width: stop * width]).decode(encoding)
+    finally:
+        shm.close()
+    owned = end - start
+    return [start + pos for pos in _MATCHERS[method](shard, pattern) if pos < owned]
+
 
 class TextAlgorithms:
-    def __init__(self, filepath="", pattern="hobbit"):
+    def __init__(self, filepath="", pattern="hobbit", stream=False, chunk_size=1 << 20):
         """
         Konstruktor wczytuje tekst do zadań 1 i 2.
+        W trybie stream=True plik nie jest wczytywany w całości -
+        search_stream() czyta go kawałkami po chunk_size znaków.
         """
         self.pattern = pattern.lower()
         self.m = len(self.pattern)
         self.text = ""
+        self.filepath = None
+        self.chunk_size = chunk_size
 
+        # Tryb strumieniowy - zapamiętujemy tylko ścieżkę
+        if filepath and stream and os.path.isfile(filepath):
+            self.filepath = filepath
         # Próba wczytania pliku
-        if filepath:
+        elif filepath:
             try:
                 with open(filepath, "r", encoding="utf-8") as f:
                     self.text = f.read().lower()
@@ -21,94 +556,202 @@ class TextAlgorithms:
             self.text = ("In a hole in the ground there lived a hobbit. " * 5000).lower()
 
         self.n = len(self.text)
+        self.index = None
 
 
     # ZADANIE 1
 
-    def search_naive(self):
+    def search_naive(self, text=None):
         start = time.time()
-        count = 0
-        for i in range(self.n - self.m + 1):
-            if self.text[i: i + self.m] == self.pattern:
-                count += 1
+        text = self.text if text is None else text
+        count = sum(1 for _ in _iter_naive(text, self._pattern_for(text)))
         return count, time.time() - start
 
     # ZADANIE 2
 
-    def search_rabin_karp(self):
+    def search_rabin_karp(self, text=None):
         start = time.time()
-        count = 0
-        d = 256;
-        q = 101
-        p = 0;
-        t = 0;
-        h = 1
-
-        for i in range(self.m - 1):
-            h = (h * d) % q
-
-        for i in range(self.m):
-            p = (d * p + ord(self.pattern[i])) % q
-            t = (d * t + ord(self.text[i])) % q
-
-        for i in range(self.n - self.m + 1):
-            if p == t:
-                if self.text[i: i + self.m] == self.pattern:
-                    count += 1
-            if i < self.n - self.m:
-                t = (d * (t - ord(self.text[i]) * h) + ord(self.text[i + self.m])) % q
-                if t < 0: t += q
+        text = self.text if text is None else text
+        count = sum(1 for _ in _iter_rabin_karp(text, self._pattern_for(text)))
         return count, time.time() - start
 
-    def search_kmp(self):
+    def search_rabin_karp_multi(self, patterns):
+        """
+        Rabin-Karp dla wielu wzorców tej samej długości w jednym przebiegu.
+        Zwraca ((wyniki, statystyki kolizji), czas).
+        """
         start = time.time()
-        count = 0
-        # Budowanie tablicy LPS
-        lps = [0] * self.m
-        length = 0;
-        i = 1
-        while i < self.m:
-            if self.pattern[i] == self.pattern[length]:
-                length += 1;
-                lps[i] = length;
-                i += 1
-            else:
-                if length != 0:
-                    length = lps[length - 1]
-                else:
-                    lps[i] = 0; i += 1
+        engine = patterns if isinstance(patterns, RollingHashSearch) else RollingHashSearch(patterns)
+        return engine.search(self.text), time.time() - start
 
-        # Wyszukiwanie
-        i = 0;
-        j = 0
-        while i < self.n:
-            if self.pattern[j] == self.text[i]:
-                i += 1;
-                j += 1
-            if j == self.m:
-                count += 1;
-                j = lps[j - 1]
-            elif i < self.n and self.pattern[j] != self.text[i]:
-                if j != 0:
-                    j = lps[j - 1]
-                else:
-                    i += 1
+    def search_kmp(self, text=None):
+        start = time.time()
+        text = self.text if text is None else text
+        count = sum(1 for _ in _iter_kmp(text, self._pattern_for(text)))
+        return count, time.time() - start
+
+    def search_boyer_moore(self, text=None):
+        start = time.time()
+        text = self.text if text is None else text
+        count = sum(1 for _ in _iter_boyer_moore(text, self._pattern_for(text)))
+        return count, time.time() - start
+
+    def _pattern_for(self, text):
+        # Dla danych binarnych wzorzec też musi być bajtami
+        if isinstance(text, (bytes, bytearray)):
+            return self.pattern.encode("utf-8")
+        return self.pattern
+
+    def search_boyer_moore_full(self, text=None):
+        """
+        Pełny Boyer-Moore (zły znak + dobry sufiks). Działa na str,
+        a dla bytes/bytearray używa tablicy przesunięć o 256 polach.
+        """
+        start = time.time()
+        text = self.text if text is None else text
+        count = sum(1 for _ in _iter_boyer_moore_full(text, self._pattern_for(text)))
         return count, time.time() - start
 
-    def search_boyer_moore(self):
+    def search_horspool(self, text=None):
+        start = time.time()
+        text = self.text if text is None else text
+        count = sum(1 for _ in _iter_horspool(text, self._pattern_for(text)))
+        return count, time.time() - start
+
+    # ROZSZERZENIE: leniwe iteratory pozycji
+
+    def finditer(self, method="horspool", limit=None, start=0, end=None, text=None):
+        """
+        Zwraca iterator pozycji dopasowań w text[start:end] (domyślnie
+        self.text). Pozycje są liczone leniwie, a po `limit` trafieniach
+        przeszukiwanie się kończy, więc pierwsze wyniki są od razu.
+        """
+        if method not in _MATCHERS:
+            raise ValueError(f"Nieznany algorytm: '{method}'")
+        text = self.text if text is None else text
+        matches = _MATCHERS[method](text, self._pattern_for(text), start, end)
+        return islice(matches, limit)
+
+    def contains(self, method="horspool", start=0, end=None):
+        # Czy wzorzec występuje choć raz - kończy na pierwszym trafieniu
+        return next(self.finditer(method, 1, start, end), None) is not None
+
+    def search_aho_corasick(self, patterns):
+        """
+        Wyszukiwanie wielu wzorców w jednym przebiegu po self.text.
+        Można przekazać listę wzorców albo gotowy automat AhoCorasick.
+        """
+        start = time.time()
+        automaton = patterns if isinstance(patterns, AhoCorasick) else AhoCorasick(patterns)
+        return automaton.search(self.text), time.time() - start
+
+    # ROZSZERZENIE: wyszukiwanie równoległe
+
+    def search_parallel(self, method="kmp", workers=None, shards=None):
+        """
+        Dzieli tekst na fragmenty zachodzące na siebie o (m - 1) znaków i
+        przeszukuje je w puli procesów. Tekst trafia raz do pamięci
+        współdzielonej (ASCII - 1 bajt na znak, inaczej UTF-32), więc nie
+        jest kopiowany do każdego procesu. Dopasowanie należy do fragmentu,
+        w którym się zaczyna, dzięki czemu nakładki nie dają duplikatów.
+        Zwraca ((liczba, posortowane pozycje), czas).
+        """
+        if method not in _MATCHERS:
+            raise ValueError(f"Nieznany algorytm: '{method}'")
+        start = time.time()
+        workers = workers or os.cpu_count() or 1
+        shards = shards or workers * 4
+        n, m = self.n, self.m
+
+        if workers == 1 or n < shards * max(m, 1) * 2:
+            offsets = list(_MATCHERS[method](self.text, self.pattern))
+            return (len(offsets), offsets), time.time() - start
+
+        if self.text.isascii():
+            encoding, width = "ascii", 1
+        else:
+            encoding, width = "utf-32-le", 4
+        data = self.text.encode(encoding)
+        shm = shared_memory.SharedMemory(create=True, size=len(data))
+        try:
+            shm.buf[:len(data)] = data
+            del data
+            step = -(-n // shards)
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [
+                    pool.submit(_search_shard, shm.name, encoding, width,
+                                lo, min(lo + step, n), min(lo + step + m - 1, n),
+                                method, self.pattern)
+                    for lo in range(0, n, step)
+                ]
+                offsets = [pos for future in futures for pos in future.result()]
+        finally:
+            shm.close()
+            shm.unlink()
+        return (len(offsets), offsets), time.time() - start
+
+    # ROZSZERZENIE: indeks tablicy sufiksów
+
+    def build_index(self, path=None):
+        """
+        Buduje tablicę sufiksów dla self.text. Jeśli podano path i plik
+        istnieje, indeks jest wczytywany z dysku; w przeciwnym razie
+        jest budowany i (gdy podano path) zapisywany.
+        """
+        start = time.time()
+        if path and os.path.isfile(path):
+            self.index = SuffixArrayIndex.load(path, self.text)
+        else:
+            self.index = SuffixArrayIndex(self.text)
+            if path:
+                self.index.save(path)
+        return self.index, time.time() - start
+
+    def search_index(self, pattern=None):
+        """
+        Zapytanie do indeksu: zwraca ((liczba, posortowane pozycje), czas).
+        """
+        if self.index is None:
+            self.build_index()
+        start = time.time()
+        pattern = self.pattern if pattern is None else pattern.lower()
+        return self.index.find(pattern), time.time() - start
+
+    # ROZSZERZENIE: wyszukiwanie strumieniowe
+
+    def search_stream(self, method="kmp"):
+        """
+        Czyta plik kawałkami po chunk_size znaków i uruchamia wybrany algorytm
+        na każdym kawałku. Kawałki zachodzą na siebie o (m - 1) znaków, więc
+        dopasowania na granicy nie giną, a żadne nie jest liczone podwójnie.
+        Zużycie pamięci zależy od chunk_size, a nie od rozmiaru pliku.
+        """
+        searchers = {
+            "naive": self.search_naive,
+            "kmp": self.search_kmp,
+            "boyer_moore": self.search_boyer_moore,
+            "rabin_karp": self.search_rabin_karp,
+            "boyer_moore_full": self.search_boyer_moore_full,
+            "horspool": self.search_horspool,
+        }
+        if method not in searchers:
+            raise ValueError(f"Nieznany algorytm: '{method}'")
+        search = searchers[method]
+
         start = time.time()
+        if self.filepath is None:
+            return search()[0], time.time() - start
+
         count = 0
-        bad_char = {self.pattern[i]: i for i in range(self.m)}
-        s = 0
-        while s <= self.n - self.m:
-            j = self.m - 1
-            while j >= 0 and self.pattern[j] == self.text[s + j]:
-                j -= 1
-            if j < 0:
-                count += 1
-                s += (self.m - bad_char.get(self.text[s + self.m], -1) if s + self.m < self.n else 1)
-            else:
-                s += max(1, j - bad_char.get(self.text[s + j], -1))
+        tail = ""
+        with open(self.filepath, "r", encoding="utf-8") as f:
+            while True:
+                block = f.read(self.chunk_size)
+                if not block:
+                    break
+                chunk = tail + block.lower()
+                count += search(chunk)[0]
+                tail = chunk[-(self.m - 1):] if self.m > 1 else ""
         return count, time.time() - start
 
 
@@ -135,21 +778,8 @@ class TextAlgorithms:
     # ZADANIE 4
 
     def solve_wildcard(self, text, pattern):
-        n, m = len(text), len(pattern)
-        dp = [[False] * (m + 1) for _ in range(n + 1)]
-        dp[0][0] = True
-
-        for j in range(1, m + 1):
-            if pattern[j - 1] == '*': dp[0][j] = dp[0][j - 1]
-
-        for i in range(1, n + 1):
-            for j in range(1, m + 1):
-                if pattern[j - 1] == text[i - 1] or pattern[j - 1] == '?':
-                    dp[i][j] = dp[i - 1][j - 1]
-                elif pattern[j - 1] == '*':
-                    dp[i][j] = dp[i][j - 1] or dp[i - 1][j]
-
-        return dp[n][m]
+        # Wzorzec kompilowany raz (cache), dopasowanie w pamięci O(m)
+        return compile_wildcard(pattern).match(text)
 
     # ZADANIE 5: Wyszukiwanie w tablicy 2D
 
@@ -176,6 +806,49 @@ class TextAlgorithms:
                             results.append(f"Start: [{r}, {c}], Kierunek: ({dr},{dc})")
         return results
 
+    def solve_2d_search_many(self, grid, words):
+        """
+        Szuka wielu słów naraz: buduje trie ze słów i z każdej komórki
+        idzie w każdym z 8 kierunków tylko tak długo, jak długo istnieje
+        pasujący prefiks w trie. Siatka może być listą list, listą
+        napisów albo tablicą znaków NumPy.
+        Zwraca słownik {słowo: [((wiersz, kolumna), (dr, dc)), ...]}.
+        """
+        rows = _grid_rows(grid)
+        results = {word: [] for word in words if word}
+        root = {}
+        for word in results:
+            node = root
+            for ch in word:
+                node = node.setdefault(ch, {})
+            node[None] = word
+
+        n_rows = len(rows)
+        n_cols = len(rows[0]) if n_rows else 0
+        directions = [(0, 1), (0, -1), (1, 0), (-1, 0), (1, 1), (1, -1), (-1, 1), (-1, -1)]
+
+        for r in range(n_rows):
+            row = rows[r]
+            for c in range(n_cols):
+                first = root.get(row[c])
+                if first is None: continue
+
+                for dr, dc in directions:
+                    node = first
+                    rr, cc = r, c
+                    while True:
+                        word = node.get(None)
+                        if word is not None:
+                            results[word].append(((r, c), (dr, dc)))
+                        rr += dr
+                        cc += dc
+                        if not (0 <= rr < n_rows and 0 <= cc < n_cols):
+                            break
+                        node = node.get(rows[rr][cc])
+                        if node is None:
+                            break
+        return results
+
 if __name__ == "__main__":
 
     algo = TextAlgorithms(filepath="Hobbit.txt", pattern="hobbit")
@@ -196,6 +869,35 @@ if __name__ == "__main__":
     cnt, t = algo.search_boyer_moore()
     print(f"{'Boyer-Moore':<20} | {cnt:<18} | {t:.6f}")
 
+    cnt, t = algo.search_boyer_moore_full()
+    print(f"{'Boyer-Moore (pełny)':<20} | {cnt:<18} | {t:.6f}")
+
+    cnt, t = algo.search_horspool()
+    print(f"{'Horspool':<20} | {cnt:<18} | {t:.6f}")
+
+    cnt, t = algo.search_horspool(algo.text.encode("utf-8"))
+    print(f"{'Horspool (bytes)':<20} | {cnt:<18} | {t:.6f}")
+
+    results_ac, t = algo.search_aho_corasick(["hobbit", "bilbo", "gandalf", "dwarf"])
+    print(f"{'Aho-Corasick':<20} | {results_ac['hobbit'][0]:<18} | {t:.6f}")
+    for word, (cnt, _) in results_ac.items():
+        print(f"  {word:<18} | {cnt}")
+
+    (results_rk, stats_rk), t = algo.search_rabin_karp_multi(["hobbit", "gollum", "dwarfs"])
+    print(f"{'Rabin-Karp (multi)':<20} | {results_rk['hobbit'][0]:<18} | {t:.6f}")
+    print(f"  okna: {stats_rk['windows']}, trafienia haszy: {stats_rk['hash_hits']}, "
+          f"fałszywe: {stats_rk['spurious_hits']}")
+
+    (cnt, _), t = algo.search_parallel("boyer_moore")
+    print(f"{'Równolegle (BM)':<20} | {cnt:<18} | {t:.6f}")
+
+    algo.build_index()
+    (cnt, _), t = algo.search_index()
+    print(f"{'Tablica sufiksów':<20} | {cnt:<18} | {t:.6f}")
+
+    print(f"Pierwsze 5 pozycji: {list(algo.finditer('kmp', limit=5))}")
+    print(f"Czy występuje 'smaug': {TextAlgorithms('Hobbit.txt', 'smaug').contains()}")
+
     print("\n=== ZADANIE 3 ===")
     test_str = "aabcdaabc"
     result = algo.solve_longest_prefix_suffix(test_str)
@@ -221,4 +923,9 @@ if __name__ == "__main__":
     print(f"Szukane słowo: {word_2d}")
     results_2d = algo.solve_2d_search(grid, word_2d)
     for res in results_2d:
-        print(res)
\ No newline at end of file
+        print(res)
+
+    words_2d = ["kot", "go", "tt", "abcd", "pies"]
+    print(f"Szukane słowa: {words_2d}")
+    for word, found in algo.solve_2d_search_many(grid, words_2d).items():
+        print(f"{word}: {found}")
\ No newline at end of file
@@ -0,0 +1,178 @@
+"""
+Benchmark algorytmów wyszukiwania wzorca z Lab9.
+
+Przykłady:
+    python benchmark.py run --output wyniki.json
+    python benchmark.py run --sizes 100000 1000000 --alphabets dna --repeats 7
+    python benchmark.py compare stare.json nowe.json --threshold 0.1
+"""
+import argparse
+import json
+import platform
+import random
+import statistics
+import string
+import sys
+import time
+import tracemalloc
+from time import perf_counter
+
+from Lab9 import TextAlgorithms
+
+ALPHABETS = {
+    "dna": "acgt",
+    "english": string.ascii_lowercase + " " * 5,
+    "bytes": "".join(chr(i) for i in range(256)).lower(),
+}
+
+ALGORITHMS = ["naive", "kmp", "rabin_karp", "boyer_moore", "boyer_moore_full", "horspool"]
+
+
+def make_pattern(length, alphabet, rng):
+    return "".join(rng.choice(alphabet) for _ in range(length))
+
+
+def make_text(size, alphabet, pattern, density, rng):
+    """
+    Losowy tekst nad alfabetem z wstawionymi wystąpieniami wzorca.
+    density to oczekiwana liczba wstawionych wystąpień na znak tekstu.
+    """
+    chars = [rng.choice(alphabet) for _ in range(size)]
+    m = len(pattern)
+    if m <= size:
+        for _ in range(int(size * density)):
+            pos = rng.randrange(size - m + 1)
+            chars[pos: pos + m] = pattern
+    return "".join(chars)
+
+
+def measure(func, warmup, repeats):
+    """
+    Zwraca (wynik, lista czasów [s], szczytowa pamięć [B]).
+    Pamięć mierzona w osobnym przebiegu, żeby tracemalloc nie zaburzał czasów.
+    """
+    for _ in range(warmup):
+        func()
+    times = []
+    result = None
+    for _ in range(repeats):
+        start = perf_counter()
+        result = func()
+        times.append(perf_counter() - start)
+
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, times, peak
+
+
+def run_suite(sizes, pattern_lengths, alphabets, densities, algorithms, warmup, repeats, seed):
+    rng = random.Random(seed)
+    results = []
+    for alphabet_name in alphabets:
+        alphabet = ALPHABETS[alphabet_name]
+        for size in sizes:
+            for m in pattern_lengths:
+                pattern = make_pattern(m, alphabet, rng)
+                algo = TextAlgorithms(pattern=pattern)
+                for density in densities:
+                    text = make_text(size, alphabet, algo.pattern, density, rng)
+                    for name in algorithms:
+                        search = getattr(algo, f"search_{name}")
+                        (count, _), times, peak = measure(lambda: search(text), warmup, repeats)
+                        row = {
+                            "algorithm": name,
+                            "alphabet": alphabet_name,
+                            "text_size": size,
+                            "pattern_length": m,
+                            "density": density,
+                            "matches": count,
+                            "min_s": min(times),
+                            "median_s": statistics.median(times),
+                            "mean_s": statistics.mean(times),
+                            "stdev_s": statistics.stdev(times) if len(times) > 1 else 0.0,
+                            "peak_bytes": peak,
+                        }
+                        results.append(row)
+                        print(f"{alphabet_name:<8} n={size:<9} m={m:<4} d={density:<7} "
+                              f"{name:<17} {row['median_s']:.6f}s  ({count} dopasowań)")
+    return results
+
+
+def _key(row):
+    return row["algorithm"], row["alphabet"], row["text_size"], row["pattern_length"], row["density"]
+
+
+def compare(old_path, new_path, threshold):
+    """
+    Porównuje medianę czasów dla wspólnych konfiguracji. Zwraca listę
+    regresji (wolniej o więcej niż threshold, np. 0.1 = 10%).
+    """
+    with open(old_path, encoding="utf-8") as f:
+        old = {_key(row): row for row in json.load(f)["results"]}
+    with open(new_path, encoding="utf-8") as f:
+        new = {_key(row): row for row in json.load(f)["results"]}
+
+    regressions = []
+    for key in sorted(old.keys() & new.keys(), key=str):
+        ratio = new[key]["median_s"] / old[key]["median_s"] if old[key]["median_s"] else 1.0
+        flag = ""
+        if ratio > 1 + threshold:
+            flag = "REGRESJA"
+            regressions.append((key, ratio))
+        elif ratio < 1 - threshold:
+            flag = "poprawa"
+        print(f"{' '.join(map(str, key)):<60} {old[key]['median_s']:.6f}s -> "
+              f"{new[key]['median_s']:.6f}s  x{ratio:.2f} {flag}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark algorytmów wyszukiwania wzorca")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run = sub.add_parser("run", help="uruchom pomiary i zapisz wyniki do JSON")
+    run.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    run.add_argument("--pattern-lengths", type=int, nargs="+", default=[4, 16, 64])
+    run.add_argument("--alphabets", nargs="+", choices=sorted(ALPHABETS), default=sorted(ALPHABETS))
+    run.add_argument("--densities", type=float, nargs="+", default=[0.0, 0.001])
+    run.add_argument("--algorithms", nargs="+", choices=ALGORITHMS, default=ALGORITHMS)
+    run.add_argument("--warmup", type=int, default=1)
+    run.add_argument("--repeats", type=int, default=5)
+    run.add_argument("--seed", type=int, default=0)
+    run.add_argument("--output", default="bench_results.json")
+
+    cmp = sub.add_parser("compare", help="porównaj dwa pliki wyników")
+    cmp.add_argument("old")
+    cmp.add_argument("new")
+    cmp.add_argument("--threshold", type=float, default=0.1)
+
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        results = run_suite(args.sizes, args.pattern_lengths, args.alphabets, args.densities,
+                            args.algorithms, args.warmup, args.repeats, args.seed)
+        meta = {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "seed": args.seed,
+            "warmup": args.warmup,
+            "repeats": args.repeats,
+        }
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"meta": meta, "results": results}, f, indent=2)
+        print(f"Zapisano {len(results)} wyników do '{args.output}'")
+        return 0
+
+    regressions = compare(args.old, args.new, args.threshold)
+    if regressions:
+        print(f"\nWykryto regresje: {len(regressions)}")
+        return 1
+    print("\nBrak regresji")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
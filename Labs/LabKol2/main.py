@@ -1,3 +1,7 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+
 def merge_sort(array):
     number_of_inversions = 0
     if len(array) <= 1:
@@ -38,8 +42,114 @@ def merge_sort(array):
 
     return number_of_inversions
 
-numbers = [8, 4, 2, 1]
-print('Unsorted array: ', numbers)
-inversions = merge_sort(numbers)
-print('Sorted array: ', numbers)
-print('Number of inversions: ', inversions)
\ No newline at end of file
+class FenwickTree:
+    def __init__(self, size):
+        self.size = size
+        self.tree = [0] * (size + 1)
+
+    def add(self, index, delta=1):
+        while index <= self.size:
+            self.tree[index] += delta
+            index += index & -index
+
+    def prefix_sum(self, index):
+        total = 0
+        while index > 0:
+            total += self.tree[index]
+            index -= index & -index
+        return total
+
+
+def compress(sequence):
+    ranks = {value: rank for rank, value in enumerate(sorted(set(sequence)), start=1)}
+    return [ranks[value] for value in sequence], len(ranks)
+
+
+def count_inversions(sequence):
+    # Fenwick tree over compressed values, the input is left unchanged
+    ranks, size = compress(sequence)
+    tree = FenwickTree(size)
+    number_of_inversions = 0
+    for seen, rank in enumerate(ranks):
+        number_of_inversions += seen - tree.prefix_sum(rank)
+        tree.add(rank)
+    return number_of_inversions
+
+
+def _chunk_inversions(chunk):
+    return count_inversions(chunk), sorted(chunk)
+
+
+def _cross_inversions(left_sorted, right_sorted):
+    # Pairs (a, b) with a from the earlier chunk, b from the later one and a > b
+    number_of_inversions = 0
+    left_index = 0
+    for value in right_sorted:
+        while left_index < len(left_sorted) and left_sorted[left_index] <= value:
+            left_index += 1
+        number_of_inversions += len(left_sorted) - left_index
+    return number_of_inversions
+
+
+def _merge_inversions(left_sorted, right_sorted, keep_merged=True):
+    # Timsort merges two sorted runs in linear time
+    merged = sorted(left_sorted + right_sorted) if keep_merged else None
+    return _cross_inversions(left_sorted, right_sorted), merged
+
+
+def count_inversions_parallel(sequence, workers=None, chunks=None):
+    # Chunks are counted on their own, then adjacent sorted runs are merged
+    # pairwise level by level, so every level moves about n elements
+    workers = workers or os.cpu_count() or 1
+    chunks = chunks or workers
+    chunk_size = max(1, -(-len(sequence) // chunks))
+    parts = [sequence[i:i + chunk_size] for i in range(0, len(sequence), chunk_size)]
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        within = list(pool.map(_chunk_inversions, parts))
+        number_of_inversions = sum(count for count, _ in within)
+        runs = [sorted_part for _, sorted_part in within]
+        while len(runs) > 1:
+            last_level = len(runs) == 2
+            merged = list(pool.map(_merge_inversions, runs[0:-1:2], runs[1::2],
+                                   [not last_level] * (len(runs) // 2)))
+            number_of_inversions += sum(count for count, _ in merged)
+            runs = [run for _, run in merged] + ([runs[-1]] if len(runs) % 2 else [])
+    return number_of_inversions
+
+
+def sliding_window_inversions(sequence, window):
+    # Yields the inversion count of every window sequence[i:i + window]
+    if window <= 0 or window > len(sequence):
+        return
+    ranks, size = compress(sequence)
+    tree = FenwickTree(size)
+    number_of_inversions = 0
+    for seen in range(window):
+        number_of_inversions += seen - tree.prefix_sum(ranks[seen])
+        tree.add(ranks[seen])
+    yield number_of_inversions
+
+    for start in range(len(sequence) - window):
+        leaving = ranks[start]
+        tree.add(leaving, -1)
+        number_of_inversions -= tree.prefix_sum(leaving - 1)
+        entering = ranks[start + window]
+        number_of_inversions += window - 1 - tree.prefix_sum(entering)
+        tree.add(entering)
+        yield number_of_inversions
+
+
+if __name__ == "__main__":
+    numbers = [8, 4, 2, 1]
+    print('Unsorted array: ', numbers)
+    inversions = merge_sort(numbers)
+    print('Sorted array: ', numbers)
+    print('Number of inversions: ', inversions)
+
+    numbers = [8, 4, 2, 1, 7, 3, 5, 6]
+    print('\nInput: ', numbers)
+    print('Number of inversions (Fenwick): ', count_inversions(numbers))
+    print('Number of inversions (parallel): ', count_inversions_parallel(numbers, workers=2, chunks=3))
+    print('Input after counting: ', numbers)
+    print('Inversions in windows of 4: ', list(sliding_window_inversions(numbers, 4)))
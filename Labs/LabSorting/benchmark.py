@@ -0,0 +1,248 @@
+"""
+Benchmark algorytmów sortowania z AdvancedSorting oraz Merge_Sort.
+
+Przykłady:
+    python benchmark.py --output wyniki
+    python benchmark.py --sizes 1000 10000 100000 1000000 --repeats 5 --label v2
+    python benchmark.py --algorithms hybrid_sort timsort --distributions sorted reversed
+
+Wyniki trafiają do <output>.csv i <output>.json.
+"""
+import argparse
+import csv
+import importlib.util
+import json
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from time import perf_counter
+
+from main import AdvancedSorting
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
+def _load_merge_sort_module():
+    spec = importlib.util.spec_from_file_location("merge_sort", REPO_ROOT / "Merge_Sort" / "merge_sort.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+# --- Rozkłady danych ---
+
+def make_data(distribution, n, rng):
+    if distribution == "sorted":
+        return list(range(n))
+    if distribution == "reversed":
+        return list(range(n, 0, -1))
+    if distribution == "sawtooth":
+        tooth = max(1, n // 16)
+        return [i % tooth for i in range(n)]
+    if distribution == "few_unique":
+        return [rng.randrange(10) for _ in range(n)]
+    if distribution == "uniform_float":
+        return [rng.random() for _ in range(n)]
+    raise ValueError(f"Nieznany rozkład: '{distribution}'")
+
+
+DISTRIBUTIONS = ["sorted", "reversed", "sawtooth", "few_unique", "uniform_float"]
+
+
+# --- Zliczanie porównań i zapisów ---
+
+class Counter:
+    comparisons = 0
+    writes = 0
+
+    @classmethod
+    def reset(cls):
+        cls.comparisons = 0
+        cls.writes = 0
+
+
+class Counted:
+    """
+    Opakowanie wartości zliczające porównania.
+    """
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __lt__(self, other):
+        Counter.comparisons += 1
+        return self.value < other.value
+
+    def __gt__(self, other):
+        Counter.comparisons += 1
+        return self.value > other.value
+
+    def __le__(self, other):
+        Counter.comparisons += 1
+        return self.value <= other.value
+
+    def __ge__(self, other):
+        Counter.comparisons += 1
+        return self.value >= other.value
+
+    def __eq__(self, other):
+        Counter.comparisons += 1
+        return self.value == other.value
+
+    __hash__ = None
+
+
+class CountingList(list):
+    """
+    Lista zliczająca zapisy przez indeks (jedna zamiana = dwa zapisy).
+    Algorytmy budujące nowe listy (append/extend) nie są tu liczone.
+    """
+
+    def __setitem__(self, index, value):
+        Counter.writes += 1 if not isinstance(index, slice) else len(value)
+        super().__setitem__(index, value)
+
+
+# --- Algorytmy ---
+
+def build_algorithms():
+    """
+    Zwraca {nazwa: (funkcja(dane), czy_da_się_zliczać, warunek_na_dane)}.
+    Funkcja dostaje własną kopię danych.
+    """
+    sorter = AdvancedSorting()
+    merge_module = _load_merge_sort_module()
+    any_data = lambda data: True
+    ints = lambda data: all(type(x) is int for x in data)
+    unit_floats = lambda data: all(type(x) is float and 0.0 <= x < 1.0 for x in data)
+    return {
+        "timsort": (sorted, True, any_data),
+        "bucket_sort": (sorter.bucket_sort, False, unit_floats),
+        "hybrid_sort": (sorter.hybrid_sort, True, any_data),
+        "heap_sort_inplace": (sorter.heap_sort_inplace, True, any_data),
+        "merge_sort": (sorter.merge_sort, True, any_data),
+        "parallel_merge_sort": (lambda data: sorter.parallel_merge_sort(data)[0], False, any_data),
+        "external_sort": (lambda data: list(sorter.external_sort(data, 'q' if ints(data) else 'd')),
+                          False, lambda data: ints(data) or unit_floats(data)),
+        "counting_sort": (sorter.counting_sort, False, ints),
+        "radix_sort": (sorter.radix_sort, False, ints),
+        "auto_sort": (sorter.auto_sort, False, any_data),
+        "Merge_Sort.merge_sort": (merge_module.merge_sort, True, any_data),
+        "Merge_Sort.merge_sort_bottom_up": (merge_module.merge_sort_bottom_up, True, any_data),
+    }
+
+
+def measure(func, data, warmup, repeats):
+    for _ in range(warmup):
+        func(list(data))
+    times = []
+    for _ in range(repeats):
+        copy = list(data)
+        start = perf_counter()
+        func(copy)
+        times.append(perf_counter() - start)
+
+    copy = list(data)
+    tracemalloc.start()
+    func(copy)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return times, peak
+
+
+def count_operations(func, data):
+    Counter.reset()
+    func(CountingList(Counted(x) for x in data))
+    return Counter.comparisons, Counter.writes
+
+
+def run(sizes, distributions, algorithms, warmup, repeats, count_limit, seed):
+    available = build_algorithms()
+    rows = []
+    for distribution in distributions:
+        for n in sizes:
+            data = make_data(distribution, n, random.Random(seed))
+            for name in algorithms:
+                func, countable, accepts = available[name]
+                if not accepts(data):
+                    continue
+                times, peak = measure(func, data, warmup, repeats)
+                comparisons = writes = None
+                if countable and n <= count_limit:
+                    comparisons, writes = count_operations(func, data)
+                row = {
+                    "algorithm": name,
+                    "distribution": distribution,
+                    "n": n,
+                    "min_s": min(times),
+                    "median_s": statistics.median(times),
+                    "mean_s": statistics.mean(times),
+                    "stdev_s": statistics.stdev(times) if len(times) > 1 else 0.0,
+                    "peak_bytes": peak,
+                    "comparisons": comparisons,
+                    "writes": writes,
+                }
+                rows.append(row)
+                print(f"{distribution:<14} n={n:<9} {name:<32} {row['median_s']:.6f}s "
+                      f"peak={peak / 1024:.0f} KiB cmp={comparisons} writes={writes}")
+    return rows
+
+
+def _git_revision():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def save(rows, output, meta):
+    with open(f"{output}.json", "w", encoding="utf-8") as f:
+        json.dump({"meta": meta, "results": rows}, f, indent=2)
+    with open(f"{output}.csv", "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=(["label", "revision"] + list(rows[0])) if rows else ["label"])
+        writer.writeheader()
+        for row in rows:
+            writer.writerow({"label": meta["label"], "revision": meta["revision"], **row})
+
+
+def main(argv=None):
+    algorithms = list(build_algorithms())
+    parser = argparse.ArgumentParser(description="Benchmark algorytmów sortowania")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--distributions", nargs="+", choices=DISTRIBUTIONS, default=DISTRIBUTIONS)
+    parser.add_argument("--algorithms", nargs="+", choices=algorithms, default=algorithms)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--count-limit", type=int, default=100_000,
+                        help="największe n, dla którego zliczane są porównania i zapisy")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--label", default="")
+    parser.add_argument("--output", default="sort_bench")
+    args = parser.parse_args(argv)
+
+    rows = run(args.sizes, args.distributions, args.algorithms,
+               args.warmup, args.repeats, args.count_limit, args.seed)
+    meta = {
+        "label": args.label,
+        "revision": _git_revision(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "seed": args.seed,
+        "warmup": args.warmup,
+        "repeats": args.repeats,
+    }
+    save(rows, args.output, meta)
+    print(f"Zapisano {len(rows)} wyników do '{args.output}.csv' i '{args.output}.json'")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
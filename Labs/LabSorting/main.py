@@ -2,7 +2,19 @@ import time
 import random
 import copy
 import heapq
+import logging
+import os
+import tempfile
+from array import array
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from multiprocessing import shared_memory
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 
 # Klasa pomocnicza
@@ -17,6 +29,249 @@ class Student:
         return f"Student(id={self.id}, name='{self.name}', score={self.score}, age={self.age})"
 
 
+class StudentTable:
+    """
+    Kolumnowe przechowywanie studentów: id, wynik i wiek w tablicach
+    array, imiona zinternowane (tablica kodów + lista unikalnych imion).
+    Sortowanie zwraca permutację indeksów zamiast kopiować obiekty.
+    """
+
+    def __init__(self):
+        self.ids = array('q')
+        self.scores = array('d')
+        self.ages = array('q')
+        self.name_codes = array('l')
+        self.names = []
+        self._name_codes = {}
+        self._keys = {}
+
+    @classmethod
+    def from_students(cls, students):
+        table = cls()
+        for s in students:
+            table.append(s.id, s.name, s.score, s.age)
+        return table
+
+    def append(self, id, name, score, age):
+        code = self._name_codes.get(name)
+        if code is None:
+            code = self._name_codes[name] = len(self.names)
+            self.names.append(name)
+        self.ids.append(id)
+        self.scores.append(score + 0.0)  # -0.0 -> 0.0, żeby klucze były równe
+        self.ages.append(age)
+        self.name_codes.append(code)
+        self._keys.clear()
+
+    def __len__(self):
+        return len(self.ids)
+
+    def row(self, i):
+        return Student(self.ids[i], self.names[self.name_codes[i]], self.scores[i], self.ages[i])
+
+    def take(self, permutation):
+        return [self.row(i) for i in permutation]
+
+    def _score_keys_desc(self):
+        # Bity double jako liczba całkowita zachowująca porządek, potem odwrócenie
+        top = (1 << 64) - 1
+        bits = memoryview(self.scores).cast('B').cast('Q')
+        return [b if b >> 63 else top - (b | (1 << 63)) for b in bits]
+
+    def sort_keys(self, criteria='score'):
+        """
+        Spakowane klucze całkowite dla danego kryterium, liczone raz
+        (do kolejnej zmiany danych).
+        """
+        keys = self._keys.get(criteria)
+        if keys is not None:
+            return keys
+        if criteria == 'score':
+            keys = array('Q', self._score_keys_desc())
+        elif criteria == 'name':
+            rank = [0] * len(self.names)
+            for r, code in enumerate(sorted(range(len(self.names)), key=self.names.__getitem__)):
+                rank[code] = r
+            keys = array('Q', [rank[c] for c in self.name_codes])
+        elif criteria == 'age_then_score':
+            min_age = min(self.ages, default=0)
+            keys = [((age - min_age) << 64) | k for age, k in zip(self.ages, self._score_keys_desc())]
+        else:
+            raise ValueError(f"Nieznane kryterium: '{criteria}'")
+        self._keys[criteria] = keys
+        return keys
+
+    def argsort(self, criteria='score'):
+        """
+        Stabilna permutacja indeksów w kolejności jak w sort_custom_objects.
+        """
+        keys = self.sort_keys(criteria)
+        return array('q', sorted(range(len(keys)), key=keys.__getitem__))
+
+
+logger = logging.getLogger(__name__)
+
+
+class _Reversed:
+    # Odwraca porządek, żeby heapq (kopiec min) działał jak kopiec max
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __lt__(self, other):
+        return other.value < self.value
+
+
+class TopK:
+    """
+    Przyrostowe Top-K: k najmniejszych (domyślnie) lub największych
+    wartości ze strumienia. Trzyma kopiec o rozmiarze k, więc pamięć O(k),
+    wstawienie O(log k), odczyt items() O(k).
+    """
+
+    def __init__(self, k, largest=False):
+        if k < 0:
+            raise ValueError("k nie może być ujemne")
+        self.k = k
+        self.largest = largest
+        self._heap = []
+
+    def __len__(self):
+        return len(self._heap)
+
+    def push(self, value):
+        heap = self._heap
+        item = value if self.largest else _Reversed(value)
+        if len(heap) < self.k:
+            heapq.heappush(heap, item)
+        elif heap and heap[0] < item:
+            heapq.heapreplace(heap, item)
+
+    def push_many(self, values):
+        push = self.push
+        heap = self._heap
+        for value in values:
+            # Szybkie odrzucenie bez tworzenia obiektów, gdy kopiec jest pełny
+            if len(heap) == self.k and heap:
+                if self.largest:
+                    if not heap[0] < value:
+                        continue
+                elif not value < heap[0].value:
+                    continue
+            push(value)
+        return self
+
+    def merge(self, other):
+        """
+        Łączy stan z innym TopK (np. z innego procesu).
+        """
+        if other.k != self.k or other.largest != self.largest:
+            raise ValueError("Można łączyć tylko TopK o tym samym k i kierunku")
+        return self.push_many(other.items())
+
+    def items(self):
+        # Kolejność nieokreślona - O(k)
+        if self.largest:
+            return list(self._heap)
+        return [item.value for item in self._heap]
+
+    def sorted(self):
+        return sorted(self.items(), reverse=self.largest)
+
+    @classmethod
+    def from_batch(cls, values, k, largest=False):
+        """
+        Tryb wsadowy w O(n): np.partition dla tablic NumPy,
+        w przeciwnym razie quickselect na liście.
+        """
+        top = cls(k, largest)
+        if k == 0:
+            return top
+        if np is not None and isinstance(values, np.ndarray):
+            if k >= len(values):
+                chosen = values.tolist()
+            elif largest:
+                chosen = np.partition(values, len(values) - k)[len(values) - k:].tolist()
+            else:
+                chosen = np.partition(values, k - 1)[:k].tolist()
+        else:
+            chosen = _quickselect(list(values), k, largest)
+        return top.push_many(chosen)
+
+
+def _quickselect(values, k, largest=False):
+    """
+    Zwraca k najmniejszych (lub największych) elementów w oczekiwanym O(n).
+    """
+    result = []
+    while k > 0 and values:
+        if len(values) <= k:
+            result.extend(values)
+            break
+        pivot = random.choice(values)
+        if largest:
+            better = [x for x in values if pivot < x]
+        else:
+            better = [x for x in values if x < pivot]
+        if len(better) >= k:
+            values = better
+            continue
+        result.extend(better)
+        k -= len(better)
+        equal = [x for x in values if not (x < pivot or pivot < x)]
+        result.extend(equal[:k])
+        k -= min(k, len(equal))
+        if largest:
+            values = [x for x in values if x < pivot]
+        else:
+            values = [x for x in values if pivot < x]
+    return result
+
+
+# Funkcje dla procesów roboczych (muszą być na poziomie modułu)
+
+def _sort_partition(part):
+    start = time.perf_counter()
+    result = AdvancedSorting().merge_sort(part)
+    return result, time.perf_counter() - start
+
+
+def _sort_shared_partition(shm_name, typecode, lo, hi):
+    """
+    Sortuje fragment [lo, hi) liczb w pamięci współdzielonej i zapisuje
+    go z powrotem na miejsce. Dane nie są przesyłane między procesami.
+    """
+    start = time.perf_counter()
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        view = shm.buf.cast(typecode)
+        part = AdvancedSorting().merge_sort(view[lo:hi].tolist())
+        view[lo:hi] = array(typecode, part)
+        view.release()
+    finally:
+        shm.close()
+    return time.perf_counter() - start
+
+
+def _numeric_typecode(arr):
+    if np is not None and isinstance(arr, np.ndarray):
+        if arr.ndim != 1:
+            return None
+        if arr.dtype.kind in 'bi' or (arr.dtype.kind == 'u' and arr.dtype.itemsize < 8):
+            return 'q'
+        if arr.dtype.kind == 'f':
+            return 'd'
+        return None
+    if all(type(x) is int for x in arr):
+        if all(-2 ** 63 <= x < 2 ** 63 for x in arr):
+            return 'q'
+        return None
+    if all(type(x) is float for x in arr):
+        return 'd'
+    return None
+
+
 # --- Główna klasa z rozwiązaniami ---
 class AdvancedSorting:
 
@@ -50,6 +305,36 @@ class AdvancedSorting:
 
         return sorted_arr
 
+    def bucket_sort_vectorized(self, arr, bucket_size=256, sample_size=10_000):
+        """
+        Wektorowy Bucket Sort w NumPy dla dowolnego zakresu i rozkładu.
+        Granice kubełków to kwantyle próbki, więc przy danych skośnych
+        kubełki mają podobną liczność. Indeksy kubełków liczy searchsorted,
+        grupowanie to stabilne sortowanie 16-bitowych indeksów (pozycyjne),
+        a każdy kubełek jest sortowany w miejscu jako ciągły wycinek.
+        Zwraca tablicę NumPy.
+        """
+        if np is None:
+            raise ImportError("bucket_sort_vectorized wymaga biblioteki NumPy")
+        values = np.asarray(arr).ravel()
+        n = values.size
+        if n < 2 or values.min() == values.max():
+            return values.copy()
+
+        # Liczba kubełków dopasowana do n, limit 2^16 - 1 dla indeksów uint16
+        bucket_count = int(min(np.iinfo(np.uint16).max, max(1, n // bucket_size)))
+        sample = values if n <= sample_size else values[np.random.default_rng(0).integers(0, n, sample_size)]
+        edges = np.unique(np.quantile(sample, np.linspace(0.0, 1.0, bucket_count + 1)[1:-1]))
+
+        indices = np.searchsorted(edges, values, side='right').astype(np.uint16)
+        grouped = values[np.argsort(indices, kind='stable')]
+        bounds = np.concatenate(([0], np.cumsum(np.bincount(indices, minlength=edges.size + 1))))
+
+        for lo, hi in zip(bounds[:-1].tolist(), bounds[1:].tolist()):
+            if hi - lo > 1:
+                grouped[lo:hi].sort()
+        return grouped
+
     # 2. SORTOWANIE NIESTANDARDOWYCH DANYCH
 
     def sort_custom_objects(self, students, criteria='score'):
@@ -80,55 +365,151 @@ class AdvancedSorting:
 
     def hybrid_sort(self, arr, threshold=32):
         """
-        Połączenie QuickSorta z Insertion Sortem.
+        Połączenie QuickSorta z Insertion Sortem (introsort w miejscu).
         Gdy podproblem jest mały (< threshold), używamy Insertion Sort,
         który jest szybszy dla małych zbiorów danych .
         """
+        return self.introsort(arr, threshold)
 
-        def insertion_sort(sub_arr):
-            for i in range(1, len(sub_arr)):
-                key = sub_arr[i]
-                j = i - 1
-                while j >= 0 and key < sub_arr[j]:
-                    sub_arr[j + 1] = sub_arr[j]
-                    j -= 1
-                sub_arr[j + 1] = key
-            return sub_arr
-
-        def quick_sort_recursive(sub_arr):
-            if len(sub_arr) < threshold:
-                return insertion_sort(sub_arr)
+    def introsort(self, arr, threshold=32):
+        """
+        Introsort w miejscu: QuickSort z medianą z trzech i podziałem na
+        trzy części (<, ==, > pivota), Insertion Sort dla małych zakresów,
+        a po przekroczeniu głębokości 2*log2(n) - HeapSort danego zakresu.
+        Zakresy już posortowane (lub ściśle malejące) kończone są w O(n).
+        Nie tworzy nowych list, więc działa też na array.array i NumPy.
+        Pamięć dodatkowa O(log n) - zawsze najpierw mniejsza część.
+        """
+        n = len(arr)
+        stack = [(0, n - 1, 2 * n.bit_length())]
+        while stack:
+            lo, hi, depth = stack.pop()
+            while hi - lo + 1 > threshold:
+                if self._sorted_run(arr, lo, hi):
+                    break
+                if depth == 0:
+                    self.heap_sort_inplace(arr, lo, hi + 1)
+                    break
+                depth -= 1
+                # Próbki w kwartylach - brzegi zakresu po podziale zawierają
+                # elementy przeniesione z bloku równych pivotowi
+                quarter = (hi - lo) // 4
+                pivot = self._median_of_three(arr, lo + quarter, (lo + hi) // 2, hi - quarter)
+                lt, gt = self._partition_3way(arr, lo, hi, pivot)
+                if lt - lo < hi - gt:
+                    stack.append((gt + 1, hi, depth))
+                    hi = lt - 1
+                else:
+                    stack.append((lo, lt - 1, depth))
+                    lo = gt + 1
             else:
-                pivot = sub_arr[len(sub_arr) // 2]
-                left = [x for x in sub_arr if x < pivot]
-                middle = [x for x in sub_arr if x == pivot]
-                right = [x for x in sub_arr if x > pivot]
-                return quick_sort_recursive(left) + middle + quick_sort_recursive(right)
+                self._insertion_sort(arr, lo, hi)
+        return arr
 
-        return quick_sort_recursive(arr)
+    def _median_of_three(self, arr, i, j, k):
+        a, b, c = arr[i], arr[j], arr[k]
+        if a < b:
+            if b < c: return b
+            return c if a < c else a
+        if a < c: return a
+        return c if b < c else b
+
+    def _sorted_run(self, arr, lo, hi):
+        # Tanie sprawdzenie: dla losowych danych kończy się po kilku porównaniach
+        i = lo
+        while i < hi and not arr[i + 1] < arr[i]:
+            i += 1
+        if i == hi:
+            return True
+        if i > lo:
+            # Posortowany zakres z kilkoma dopisanymi na końcu elementami
+            if hi - i <= 8:
+                self._insertion_sort(arr, lo, hi)
+                return True
+            return False
+        # Ściśle malejący zakres - odwracamy w miejscu
+        while i < hi and arr[i + 1] < arr[i]:
+            i += 1
+        if i < hi:
+            return False
+        while lo < hi:
+            arr[lo], arr[hi] = arr[hi], arr[lo]
+            lo += 1
+            hi -= 1
+        return True
+
+    def _partition_3way(self, arr, lo, hi, pivot):
+        # Podział Bentleya-McIlroya: skanowanie z obu końców jak u Hoare'a
+        # (posortowany zakres nie jest przestawiany), elementy równe pivotowi
+        # odkładane na brzegi, a na końcu przenoszone do środka.
+        # Wynik: [lo, lt) < pivot, [lt, gt] == pivot, (gt, hi] > pivot
+        i, j = lo, hi
+        p, q = lo, hi
+        while True:
+            while i <= j and arr[i] < pivot:
+                i += 1
+            while i <= j and pivot < arr[j]:
+                j -= 1
+            if i > j:
+                break
+            if i == j:
+                # arr[i] == pivot
+                arr[p], arr[i] = arr[i], arr[p]
+                p += 1
+                i += 1
+                break
+            arr[i], arr[j] = arr[j], arr[i]
+            if not arr[i] < pivot:
+                arr[p], arr[i] = arr[i], arr[p]
+                p += 1
+            if not pivot < arr[j]:
+                arr[q], arr[j] = arr[j], arr[q]
+                q -= 1
+            i += 1
+            j -= 1
+
+        # Teraz: [lo, p) ==, [p, i) <, (j, q] >, (q, hi] ==, przy czym j == i - 1
+        for k in range(min(p - lo, i - p)):
+            arr[lo + k], arr[i - 1 - k] = arr[i - 1 - k], arr[lo + k]
+        for k in range(min(q - j, hi - q)):
+            arr[j + 1 + k], arr[hi - k] = arr[hi - k], arr[j + 1 + k]
+        return lo + (i - p), hi - (q - j)
+
+    def _insertion_sort(self, arr, lo, hi):
+        for i in range(lo + 1, hi + 1):
+            key = arr[i]
+            j = i - 1
+            while j >= lo and key < arr[j]:
+                arr[j + 1] = arr[j]
+                j -= 1
+            arr[j + 1] = key
 
     # 5. IN-PLACE (HeapSort) vs OUT-OF-PLACE (MergeSort)
 
-    def heap_sort_inplace(self, arr):
-        n = len(arr)
+    def heap_sort_inplace(self, arr, lo=0, hi=None):
+        """
+        Sortuje arr[lo:hi] w miejscu (domyślnie całą tablicę).
+        """
+        hi = len(arr) if hi is None else hi
+        n = hi - lo
         # Budowanie sterty
         for i in range(n // 2 - 1, -1, -1):
-            self._heapify(arr, n, i)
+            self._heapify(arr, n, i, lo)
         # Wyjmowanie elementów
         for i in range(n - 1, 0, -1):
-            arr[i], arr[0] = arr[0], arr[i]  # Swap
-            self._heapify(arr, i, 0)
+            arr[lo + i], arr[lo] = arr[lo], arr[lo + i]  # Swap
+            self._heapify(arr, i, 0, lo)
         return arr
 
-    def _heapify(self, arr, n, i):
+    def _heapify(self, arr, n, i, lo=0):
         largest = i
         l = 2 * i + 1
         r = 2 * i + 2
-        if l < n and arr[l] > arr[largest]: largest = l
-        if r < n and arr[r] > arr[largest]: largest = r
+        if l < n and arr[lo + l] > arr[lo + largest]: largest = l
+        if r < n and arr[lo + r] > arr[lo + largest]: largest = r
         if largest != i:
-            arr[i], arr[largest] = arr[largest], arr[i]
-            self._heapify(arr, n, largest)
+            arr[lo + i], arr[lo + largest] = arr[lo + largest], arr[lo + i]
+            self._heapify(arr, n, largest, lo)
 
     def merge_sort(self, arr):
         if len(arr) <= 1: return arr
@@ -151,6 +532,266 @@ class AdvancedSorting:
         result.extend(right[j:])
         return result
 
+    # 6. SORTOWANIE ZEWNĘTRZNE (External Merge Sort)
+
+    def external_sort(self, stream, typecode='d', memory_budget=64 * 2 ** 20,
+                      run_size=None, fan_in=16, tmp_dir=None, block_size=8192):
+        """
+        Sortowanie danych większych niż RAM. Wejście czytane jest strumieniowo,
+        kolejne serie (po run_size liczb) sortowane są w pamięci przez
+        merge_sort i zapisywane binarnie (array.tofile) do plików tymczasowych.
+        Następnie serie są scalane kopcem po fan_in naraz, aż zostanie jedna.
+        Zwraca generator posortowanych wartości.
+        typecode - format rekordu jak w module array ('d', 'q', 'i', ...).
+        """
+        # Walidacja od razu przy wywołaniu, a nie przy pierwszym next()
+        if fan_in < 2:
+            raise ValueError("fan_in musi wynosić co najmniej 2")
+        itemsize = array(typecode).itemsize
+        if run_size is None:
+            # Seria w liście Pythona zajmuje ok. 4x więcej niż surowe dane
+            run_size = max(1, memory_budget // (4 * itemsize))
+        return self._external_sort(stream, typecode, run_size, fan_in, tmp_dir, block_size)
+
+    def _external_sort(self, stream, typecode, run_size, fan_in, tmp_dir, block_size):
+        tmp = tempfile.TemporaryDirectory(dir=tmp_dir)
+        try:
+            runs = []
+            buffer = []
+            for value in stream:
+                buffer.append(value)
+                if len(buffer) >= run_size:
+                    runs.append(self._write_run(self.merge_sort(buffer), typecode, tmp.name, block_size))
+                    buffer = []
+            if buffer or not runs:
+                runs.append(self._write_run(self.merge_sort(buffer), typecode, tmp.name, block_size))
+            del buffer
+
+            # Kolejne przebiegi scalania, dopóki nie zostanie fan_in serii
+            while len(runs) > fan_in:
+                merged = []
+                for i in range(0, len(runs), fan_in):
+                    group = runs[i: i + fan_in]
+                    merged.append(self._write_run(
+                        heapq.merge(*(self._read_run(r, typecode, block_size) for r in group)),
+                        typecode, tmp.name, block_size))
+                    for r in group:
+                        os.remove(r)
+                runs = merged
+
+            yield from heapq.merge(*(self._read_run(r, typecode, block_size) for r in runs))
+        finally:
+            tmp.cleanup()
+
+    def _write_run(self, values, typecode, directory, block_size=8192):
+        fd, path = tempfile.mkstemp(suffix=".run", dir=directory)
+        with os.fdopen(fd, "wb") as f:
+            block = array(typecode)
+            for value in values:
+                block.append(value)
+                if len(block) >= block_size:
+                    block.tofile(f)
+                    block = array(typecode)
+            block.tofile(f)
+        return path
+
+    def _read_run(self, path, typecode, block_size):
+        with open(path, "rb") as f:
+            while True:
+                block = array(typecode)
+                try:
+                    block.fromfile(f, block_size)
+                except EOFError:
+                    # Ostatni, niepełny blok - fromfile i tak go wczytało
+                    pass
+                if not block:
+                    return
+                yield from block
+
+    # 7. RÓWNOLEGŁY MERGE SORT
+
+    def parallel_merge_sort(self, arr, workers=None, threshold=50_000, compare_serial=False):
+        """
+        Dzieli dane na `workers` części sortowane merge_sortem w puli procesów,
+        a potem scala je k-drogowo (heapq.merge). Liczby całkowite i
+        zmiennoprzecinkowe (także tablice NumPy) trafiają do pamięci
+        współdzielonej zamiast być serializowane. Poniżej progu `threshold`
+        działa zwykły merge_sort.
+        Zwraca (posortowana lista, statystyki). Przy compare_serial=True
+        przyspieszenie liczone jest względem zmierzonego merge_sort,
+        w przeciwnym razie względem sumy czasów CPU części + scalania.
+        """
+        workers = workers or os.cpu_count() or 1
+        n = len(arr)
+        stats = {"n": n, "workers": workers, "mode": "serial"}
+
+        start = time.perf_counter()
+        if n < threshold or workers == 1:
+            result = self.merge_sort(list(arr))
+            stats["wall_s"] = stats["serial_s"] = time.perf_counter() - start
+            stats["speedup"] = 1.0
+            return result, stats
+
+        step = -(-n // workers)
+        bounds = [(lo, min(lo + step, n)) for lo in range(0, n, step)]
+        typecode = _numeric_typecode(arr)
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            if typecode is not None:
+                stats["mode"] = "shared_memory"
+                shm = shared_memory.SharedMemory(create=True, size=max(1, n * array(typecode).itemsize))
+                try:
+                    view = shm.buf.cast(typecode)
+                    if np is not None and isinstance(arr, np.ndarray):
+                        # Bufor NumPy kopiowany bezpośrednio do segmentu
+                        np.frombuffer(shm.buf, dtype=np.int64 if typecode == 'q' else np.float64,
+                                      count=n)[:] = arr
+                    else:
+                        view[:n] = array(typecode, arr)
+                    cpu_times = list(pool.map(_sort_shared_partition, [shm.name] * len(bounds),
+                                              [typecode] * len(bounds),
+                                              [lo for lo, _ in bounds], [hi for _, hi in bounds]))
+                    parts = [view[lo:hi].tolist() for lo, hi in bounds]
+                    view.release()
+                finally:
+                    shm.close()
+                    shm.unlink()
+            else:
+                stats["mode"] = "pickle"
+                sorted_parts = list(pool.map(_sort_partition, [arr[lo:hi] for lo, hi in bounds]))
+                parts = [part for part, _ in sorted_parts]
+                cpu_times = [t for _, t in sorted_parts]
+
+        merge_start = time.perf_counter()
+        result = list(heapq.merge(*parts))
+        merge_time = time.perf_counter() - merge_start
+        stats["wall_s"] = time.perf_counter() - start
+
+        if compare_serial:
+            serial_start = time.perf_counter()
+            self.merge_sort(list(arr))
+            stats["serial_s"] = time.perf_counter() - serial_start
+        else:
+            stats["serial_s"] = sum(cpu_times) + merge_time
+        stats["speedup"] = stats["serial_s"] / stats["wall_s"] if stats["wall_s"] else 1.0
+        return result, stats
+
+    # 8. SORTOWANIE PRZEZ ZLICZANIE / POZYCYJNE I AUTOMATYCZNY WYBÓR
+
+    def counting_sort(self, arr):
+        """
+        Dla liczb całkowitych z małego zakresu: O(n + k), k = max - min + 1.
+        """
+        if not len(arr): return []
+        # Zliczanie w C (Counter), potem przejście po zakresie min..max
+        return self._counting_from_counts(Counter(arr))
+
+    def _counting_from_counts(self, counts):
+        result = []
+        for value in range(min(counts), max(counts) + 1):
+            c = counts.get(value)
+            if c:
+                result.extend([value] * c)
+        return result
+
+    def radix_sort(self, arr, digit_bits=16):
+        """
+        LSD Radix Sort dla liczb całkowitych (także ujemnych - przesunięcie
+        o minimum). Każdy przebieg to stabilne zliczanie po jednej cyfrze.
+        """
+        if not arr: return []
+        low = min(arr)
+        values = [x - low for x in arr]
+        mask = (1 << digit_bits) - 1
+        for shift in range(0, max(values).bit_length(), digit_bits):
+            buckets = [[] for _ in range(mask + 1)]
+            for v in values:
+                buckets[(v >> shift) & mask].append(v)
+            values = [v for bucket in buckets for v in bucket]
+        return [v + low for v in values]
+
+    def profile(self, arr, sample_size=1024):
+        """
+        Szybki profil danych na próbce: typ, zakres, uporządkowanie
+        (odsetek sąsiednich par w kolejności) i odsetek duplikatów.
+        """
+        n = len(arr)
+        info = {"n": n}
+        if n == 0:
+            info["kind"] = "empty"
+            return info
+        # Ciągły fragment zachowuje informację o uporządkowaniu sąsiadów
+        start = random.randrange(n - sample_size + 1) if n > sample_size else 0
+        if np is not None and isinstance(arr, np.ndarray):
+            # Typ tablicy NumPy wynika z dtype, próbka jako liczby Pythona
+            info["dtype"] = str(arr.dtype)
+            sample = arr.ravel()[start: start + sample_size].tolist()
+        else:
+            sample = list(arr[start: start + sample_size])
+        if all(type(x) is int for x in sample):
+            info["kind"] = "int"
+        elif all(type(x) is float for x in sample):
+            info["kind"] = "float"
+        else:
+            info["kind"] = "other"
+        pairs = max(1, len(sample) - 1)
+        info["ascending"] = sum(1 for a, b in zip(sample, sample[1:]) if not b < a) / pairs
+        info["descending"] = sum(1 for a, b in zip(sample, sample[1:]) if not a < b) / pairs
+        try:
+            info["duplicates"] = 1 - len(set(sample)) / len(sample)
+        except TypeError:
+            info["duplicates"] = 0.0
+        if info["kind"] in ("int", "float"):
+            info["min"], info["max"] = min(sample), max(sample)
+        return info
+
+    def auto_sort(self, arr):
+        """
+        Wybiera algorytm na podstawie profilu danych i zwraca posortowaną
+        listę (dla tablicy NumPy - tablicę). Wybór i jego powód trafiają do
+        logu oraz do self.last_strategy. Domyślnie Timsort - w CPython
+        wbudowane sortowanie jest szybsze od implementacji w Pythonie,
+        więc inne algorytmy wybierane są tylko tam, gdzie wygrywają.
+        """
+        info = self.profile(arr)
+        n = info["n"]
+        kind = info["kind"]
+        nearly_sorted = n > 0 and (info["ascending"] >= 0.95 or info["descending"] >= 0.95)
+
+        if "dtype" in info:
+            if nearly_sorted:
+                strategy, reason = "numpy_stable", f"tablica NumPy ({info['dtype']}), dane prawie posortowane"
+            else:
+                strategy, reason = "numpy", f"tablica NumPy ({info['dtype']})"
+        elif n < 100_000:
+            strategy, reason = "timsort", f"n={n} - za mało danych, by opłacił się inny algorytm"
+        elif nearly_sorted:
+            strategy, reason = "timsort", "dane prawie posortowane - Timsort wykorzysta serie"
+        elif kind == "int" and info["max"] - info["min"] < n // 20 and set(map(type, arr)) == {int}:
+            # Zakres z próbki to tylko dolne oszacowanie - decyduje pełne zliczenie
+            counts = Counter(arr)
+            span = max(counts) - min(counts) + 1
+            if span <= n // 20:
+                strategy, reason = "counting", f"liczby całkowite, zakres {span} <= n/20"
+            else:
+                strategy, reason = "timsort", f"liczby całkowite z szerokiego zakresu ({span})"
+        elif (kind == "float" and info["duplicates"] < 0.5 and np is not None
+              and set(map(type, arr)) == {float}):
+            strategy, reason = "numpy", "duża lista liczb zmiennoprzecinkowych - np.sort"
+        else:
+            strategy, reason = "timsort", "brak szczególnej struktury"
+
+        self.last_strategy = (strategy, reason)
+        logger.info("auto_sort: %s (%s)", strategy, reason)
+
+        if strategy in ("numpy", "numpy_stable"):
+            kind = "stable" if strategy == "numpy_stable" else None
+            if isinstance(arr, np.ndarray):
+                return np.sort(arr, axis=None, kind=kind)
+            return np.sort(np.asarray(arr, dtype=np.float64), kind=kind).tolist()
+        if strategy == "counting":
+            return self._counting_from_counts(counts)
+        return sorted(arr)
 
 if __name__ == "__main__":
     sorter = AdvancedSorting()
@@ -166,6 +807,14 @@ if __name__ == "__main__":
     t_standard = time.time() - start
     print(f"Bucket Sort: {t_bucket:.6f}s | Timsort: {t_standard:.6f}s")
 
+    if np is not None:
+        data_skewed = np.random.default_rng(0).lognormal(0.0, 2.0, 1_000_000)
+        start = time.time()
+        result = sorter.bucket_sort_vectorized(data_skewed)
+        t_vec = time.time() - start
+        print(f"Bucket Sort (NumPy, rozkład log-normalny, 1mln): {t_vec:.6f}s | "
+              f"poprawnie: {bool(np.all(result[:-1] <= result[1:]))}")
+
     print("\n--- 2. TEST DANYCH NIESTANDARDOWYCH ---")
     students = [
         Student(1, "Ania", 4.5, 21),
@@ -176,6 +825,9 @@ if __name__ == "__main__":
     print("Oryginalnie:", students)
     print("Wg oceny (malejąco):", sorter.sort_custom_objects(students, 'score'))
     print("Wg wieku potem oceny:", sorter.sort_custom_objects(students, 'age_then_score'))
+    table = StudentTable.from_students(students)
+    order = table.argsort('age_then_score')
+    print("StudentTable (permutacja):", list(order), table.take(order[:2]))
 
     print("\n--- 3. TEST SORTOWANIA CZĄSTKOWEGO (Top K) ---")
     big_data = [random.randint(0, 100000) for _ in range(1_000_000)]
@@ -192,6 +844,27 @@ if __name__ == "__main__":
     print(f"Partial Sort (Heap): {t_partial:.6f}s | Full Sort + Slice: {t_full:.6f}s")
     print("Wynik Partial:", top_k)
 
+    start = time.time()
+    stream_top = TopK(k)
+    for i in range(0, len(big_data), 100_000):
+        stream_top.push_many(big_data[i: i + 100_000])
+    t_stream = time.time() - start
+    start = time.time()
+    batch_top = TopK.from_batch(big_data, k)
+    t_batch = time.time() - start
+    print(f"TopK (strumień): {t_stream:.6f}s | TopK (quickselect): {t_batch:.6f}s")
+    print("Wynik TopK:", stream_top.sorted(), stream_top.sorted() == batch_top.sorted())
+
+    print("\n--- 3b. AUTOMATYCZNY WYBÓR ALGORYTMU ---")
+    for name, data in [("randint(0, 100000)", big_data),
+                       ("random()", data_float),
+                       ("posortowane", sorted(data_float)),
+                       ("randint(0, 10**12)", [random.randint(0, 10 ** 12) for _ in range(100_000)])]:
+        start = time.time()
+        result = sorter.auto_sort(data)
+        strategy, reason = sorter.last_strategy
+        print(f"{name:<20} -> {strategy:<10} {time.time() - start:.6f}s  ({reason})")
+
     print("\n--- 4. TEST HYBRYDOWY ---")
     data_hybrid = [random.randint(0, 1000) for _ in range(5000)]
     start = time.time()
@@ -210,4 +883,22 @@ if __name__ == "__main__":
     sorter.merge_sort(data_oop)
     t_out = time.time() - start
 
-    print(f"HeapSort (In-Place): {t_in:.6f}s | MergeSort (Out-of-Place): {t_out:.6f}s")
\ No newline at end of file
+    print(f"HeapSort (In-Place): {t_in:.6f}s | MergeSort (Out-of-Place): {t_out:.6f}s")
+
+    print("\n--- 6. SORTOWANIE ZEWNĘTRZNE ---")
+    stream = (random.random() for _ in range(200_000))
+    start = time.time()
+    previous = None
+    count = 0
+    for value in sorter.external_sort(stream, 'd', run_size=20_000, fan_in=4):
+        assert previous is None or previous <= value
+        previous = value
+        count += 1
+    print(f"External Merge Sort ({count} liczb, serie po 20 000): {time.time() - start:.6f}s")
+
+    print("\n--- 7. RÓWNOLEGŁY MERGE SORT ---")
+    data_par = [random.randint(0, 10 ** 9) for _ in range(400_000)]
+    result, stats = sorter.parallel_merge_sort(data_par, compare_serial=True)
+    print(f"Tryb: {stats['mode']}, procesy: {stats['workers']}, "
+          f"czas: {stats['wall_s']:.6f}s, szeregowo: {stats['serial_s']:.6f}s, "
+          f"przyspieszenie: x{stats['speedup']:.2f}")
\ No newline at end of file
@@ -32,8 +32,91 @@ def merge_sort(array):
         right_array_index += 1
         sorted_index += 1
 
-numbers = [4, 10, 6, 14, 2, 1, 8, 5]
-print('Unsorted array: ')
-print(numbers)
-merge_sort(numbers)
-print('Sorted array: ', numbers)
+def merge_sort_bottom_up(array, key=None):
+    n = len(array)
+    if n <= 1:
+        return
+
+    keys = array if key is None else [key(item) for item in array]
+
+    # Natural runs: ascending runs are kept, strictly descending ones reversed
+    run_bounds = [0]
+    run_start = 0
+    while run_start < n:
+        run_end = run_start + 1
+        if run_end < n and keys[run_end] < keys[run_start]:
+            while run_end < n and keys[run_end] < keys[run_end - 1]:
+                run_end += 1
+            array[run_start:run_end] = array[run_start:run_end][::-1]
+            if keys is not array:
+                keys[run_start:run_end] = keys[run_start:run_end][::-1]
+        else:
+            while run_end < n and not keys[run_end] < keys[run_end - 1]:
+                run_end += 1
+        run_bounds.append(run_end)
+        run_start = run_end
+
+    if len(run_bounds) == 2:
+        return
+
+    # One auxiliary buffer, values ping-pong between it and the array
+    source, source_keys = array, keys
+    target = [None] * n
+    target_keys = target if keys is array else [None] * n
+
+    while len(run_bounds) > 2:
+        merged_bounds = [0]
+        for run in range(0, len(run_bounds) - 1, 2):
+            low = run_bounds[run]
+            middle_point = run_bounds[run + 1]
+            high = run_bounds[run + 2] if run + 2 < len(run_bounds) else middle_point
+            _merge_runs(source, source_keys, target, target_keys, low, middle_point, high)
+            merged_bounds.append(high)
+        run_bounds = merged_bounds
+        source, target = target, source
+        source_keys, target_keys = target_keys, source_keys
+
+    if source is not array:
+        array[:] = source
+
+
+def _merge_runs(source, source_keys, target, target_keys, low, middle_point, high):
+    with_keys = source_keys is not source
+    left_index = low
+    right_index = middle_point
+    sorted_index = low
+
+    while left_index < middle_point and right_index < high:
+        if source_keys[right_index] < source_keys[left_index]:
+            target[sorted_index] = source[right_index]
+            if with_keys:
+                target_keys[sorted_index] = source_keys[right_index]
+            right_index += 1
+        else:
+            target[sorted_index] = source[left_index]
+            if with_keys:
+                target_keys[sorted_index] = source_keys[left_index]
+            left_index += 1
+        sorted_index += 1
+
+    rest = slice(sorted_index, high)
+    if left_index < middle_point:
+        target[rest] = source[left_index:middle_point]
+        if with_keys:
+            target_keys[rest] = source_keys[left_index:middle_point]
+    else:
+        target[rest] = source[right_index:high]
+        if with_keys:
+            target_keys[rest] = source_keys[right_index:high]
+
+
+if __name__ == "__main__":
+    numbers = [4, 10, 6, 14, 2, 1, 8, 5]
+    print('Unsorted array: ')
+    print(numbers)
+    merge_sort(numbers)
+    print('Sorted array: ', numbers)
+
+    words = ['pear', 'fig', 'apple', 'kiwi', 'banana', 'plum']
+    merge_sort_bottom_up(words, key=len)
+    print('Sorted by length (stable): ', words)
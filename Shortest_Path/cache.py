@@ -0,0 +1,110 @@
+import sys
+from collections import OrderedDict
+
+from shortest import build_path, dijkstra, my_graph
+
+
+class ShortestPathService:
+    # Caches one shortest-path tree (distances + predecessors) per source,
+    # evicts the least recently used trees past the memory budget and drops
+    # only the trees that an edge change can actually affect
+
+    def __init__(self, graph, max_bytes=64 * 2 ** 20, undirected=False):
+        self.graph = graph
+        self.max_bytes = max_bytes
+        self.undirected = undirected
+        self.trees = OrderedDict()
+        self.sizes = {}
+        self.used_bytes = 0
+        self.stats = {'hits': 0, 'misses': 0, 'evictions': 0, 'invalidations': 0}
+
+    def _tree(self, source):
+        tree = self.trees.get(source)
+        if tree is not None:
+            self.stats['hits'] += 1
+            self.trees.move_to_end(source)
+            return tree
+
+        self.stats['misses'] += 1
+        tree = dijkstra(self.graph, source)
+        size = self._tree_size(tree)
+        self.trees[source] = tree
+        self.sizes[source] = size
+        self.used_bytes += size
+        # The newest tree always stays, even if it alone exceeds the budget
+        while self.used_bytes > self.max_bytes and len(self.trees) > 1:
+            oldest, _ = self.trees.popitem(last=False)
+            self.used_bytes -= self.sizes.pop(oldest)
+            self.stats['evictions'] += 1
+        return tree
+
+    @staticmethod
+    def _tree_size(tree):
+        # Both dict tables plus the distance objects; keys and predecessors
+        # are the graph's own node labels and are not counted again
+        distances, predecessors = tree
+        return (sys.getsizeof(distances) + sys.getsizeof(predecessors)
+                + sum(sys.getsizeof(distance) for distance in distances.values()))
+
+    def distances(self, source):
+        return self._tree(source)[0]
+
+    def query(self, source, target):
+        distances, predecessors = self._tree(source)
+        return distances.get(target, float('inf')), build_path(predecessors, target)
+
+    def _drop(self, source):
+        del self.trees[source]
+        self.used_bytes -= self.sizes.pop(source)
+        self.stats['invalidations'] += 1
+
+    def _arc_changed(self, u, v, old_weight, new_weight):
+        for source, (distances, predecessors) in list(self.trees.items()):
+            if old_weight is not None and (new_weight is None or new_weight > old_weight):
+                # A longer or removed arc matters only if the tree uses it
+                affected = predecessors.get(v) == u and distances[v] == distances[u] + old_weight
+            elif new_weight is not None and (old_weight is None or new_weight < old_weight):
+                # A shorter or new arc matters only if it improves some distance
+                affected = distances.get(u, float('inf')) + new_weight < distances.get(v, float('inf'))
+            else:
+                affected = False
+            if affected:
+                self._drop(source)
+
+    def _set_arc(self, u, v, weight):
+        edges = self.graph.setdefault(u, [])
+        self.graph.setdefault(v, [])
+        old_weights = [w for node, w in edges if node == v]
+        old_weight = min(old_weights) if old_weights else None
+        edges[:] = [(node, w) for node, w in edges if node != v]
+        if weight is not None:
+            edges.append((v, weight))
+        self._arc_changed(u, v, old_weight, weight)
+
+    def set_edge(self, u, v, weight):
+        # Adds a new edge or reweights an existing one
+        self._set_arc(u, v, weight)
+        if self.undirected:
+            self._set_arc(v, u, weight)
+
+    def remove_edge(self, u, v):
+        self._set_arc(u, v, None)
+        if self.undirected:
+            self._set_arc(v, u, None)
+
+    def cache_info(self):
+        return dict(self.stats, entries=len(self.trees), used_bytes=self.used_bytes,
+                    max_bytes=self.max_bytes)
+
+
+if __name__ == "__main__":
+    service = ShortestPathService({node: list(edges) for node, edges in my_graph.items()},
+                                  undirected=True)
+    print(service.query('A', 'F'))
+    print(service.query('A', 'E'))
+    print(service.query('B', 'E'))
+    service.set_edge('D', 'E', 1)
+    print(service.query('A', 'E'))
+    service.set_edge('A', 'B', 7)
+    print(service.query('B', 'E'))
+    print(service.cache_info())
@@ -0,0 +1,203 @@
+import heapq
+import pickle
+
+from shortest import my_graph, shortest_path
+
+
+class ContractionHierarchy:
+    # Built once from the adjacency-dict format used in shortest.py,
+    # then answers queries with an upward/downward bidirectional search
+
+    def __init__(self, graph=None, witness_settle_limit=50):
+        self.rank = {}
+        self.upward = {}
+        self.downward = {}
+        self.shortcuts = {}
+        if graph is not None:
+            self._build(graph, witness_settle_limit)
+
+    def _build(self, graph, witness_settle_limit):
+        outgoing = {}
+        incoming = {}
+        for node, edges in graph.items():
+            outgoing.setdefault(node, {})
+            incoming.setdefault(node, {})
+            for neighbour, weight in edges:
+                outgoing.setdefault(neighbour, {})
+                incoming.setdefault(neighbour, {})
+                if neighbour != node and weight < outgoing[node].get(neighbour, float('inf')):
+                    outgoing[node][neighbour] = weight
+                    incoming[neighbour][node] = weight
+
+        # Every edge (original or shortcut) that survives contraction
+        all_edges = {(u, v): w for u in outgoing for v, w in outgoing[u].items()}
+        contracted_neighbours = dict.fromkeys(outgoing, 0)
+
+        def needed_shortcuts(node):
+            shortcuts = []
+            targets = {v: w for v, w in outgoing[node].items()}
+            for u, weight_in in incoming[node].items():
+                if not targets:
+                    break
+                limit = weight_in + max(targets.values())
+                witness = self._witness_search(outgoing, u, node, limit, witness_settle_limit)
+                for v, weight_out in targets.items():
+                    if v == u:
+                        continue
+                    via = weight_in + weight_out
+                    if witness.get(v, float('inf')) > via:
+                        shortcuts.append((u, v, via))
+            return shortcuts
+
+        def priority(node):
+            # The shortcut list is returned too, so contraction can reuse it
+            shortcuts = needed_shortcuts(node)
+            edge_difference = len(shortcuts) - len(incoming[node]) - len(outgoing[node])
+            return edge_difference + contracted_neighbours[node], shortcuts
+
+        queue = [(priority(node)[0], index, node) for index, node in enumerate(outgoing)]
+        heapq.heapify(queue)
+        order = 0
+        while queue:
+            _, index, node = heapq.heappop(queue)
+            # Lazy update: re-evaluate and put back if it is no longer the minimum
+            current, shortcuts = priority(node)
+            if queue and current > queue[0][0]:
+                heapq.heappush(queue, (current, index, node))
+                continue
+
+            for u, v, via in shortcuts:
+                if via < outgoing[u].get(v, float('inf')):
+                    outgoing[u][v] = via
+                    incoming[v][u] = via
+                    all_edges[(u, v)] = via
+                    self.shortcuts[(u, v)] = node
+
+            for neighbour in list(outgoing[node]):
+                del incoming[neighbour][node]
+                contracted_neighbours[neighbour] += 1
+            for neighbour in list(incoming[node]):
+                del outgoing[neighbour][node]
+                contracted_neighbours[neighbour] += 1
+            outgoing[node] = {}
+            incoming[node] = {}
+
+            self.rank[node] = order
+            order += 1
+
+        self.upward = {node: [] for node in self.rank}
+        self.downward = {node: [] for node in self.rank}
+        for (u, v), weight in all_edges.items():
+            if self.rank[u] < self.rank[v]:
+                self.upward[u].append((v, weight))
+            else:
+                # Backward search from the target climbs reversed edges
+                self.downward[v].append((u, weight))
+
+    @staticmethod
+    def _witness_search(outgoing, start, excluded, limit, settle_limit):
+        distances = {start: 0}
+        queue = [(0, start)]
+        settled = 0
+        while queue and settled < settle_limit:
+            distance, current = heapq.heappop(queue)
+            if distance > distances.get(current, float('inf')):
+                continue
+            if distance > limit:
+                break
+            settled += 1
+            for node, weight in outgoing[current].items():
+                if node == excluded:
+                    continue
+                new_distance = distance + weight
+                if new_distance < distances.get(node, float('inf')):
+                    distances[node] = new_distance
+                    heapq.heappush(queue, (new_distance, node))
+        return distances
+
+    def query(self, start, target):
+        if start not in self.rank or target not in self.rank:
+            return float('inf'), []
+        graphs = (self.upward, self.downward)
+        distances = ({start: 0}, {target: 0})
+        predecessors = ({start: None}, {target: None})
+        settled = (set(), set())
+        queues = ([(0, start)], [(0, target)])
+        best, meeting = (0, start) if start == target else (float('inf'), None)
+
+        while queues[0] or queues[1]:
+            for side in (0, 1):
+                queue = queues[side]
+                if not queue:
+                    continue
+                distance, current = heapq.heappop(queue)
+                if distance >= best:
+                    queue.clear()
+                    continue
+                if current in settled[side]:
+                    continue
+                settled[side].add(current)
+                if current in distances[1 - side]:
+                    total = distance + distances[1 - side][current]
+                    if total < best:
+                        best, meeting = total, current
+                for node, weight in graphs[side][current]:
+                    new_distance = distance + weight
+                    if new_distance < distances[side].get(node, float('inf')):
+                        distances[side][node] = new_distance
+                        predecessors[side][node] = current
+                        heapq.heappush(queue, (new_distance, node))
+
+        if meeting is None:
+            return float('inf'), []
+        forward = self._chain(predecessors[0], meeting)[::-1]
+        backward = self._chain(predecessors[1], meeting)
+        return best, self._unpack(forward + backward[1:])
+
+    @staticmethod
+    def _chain(predecessors, node):
+        chain = []
+        while node is not None:
+            chain.append(node)
+            node = predecessors[node]
+        return chain
+
+    def _unpack(self, path):
+        result = [path[0]]
+        stack = [(u, v) for u, v in reversed(list(zip(path, path[1:])))]
+        while stack:
+            u, v = stack.pop()
+            middle = self.shortcuts.get((u, v))
+            if middle is None:
+                result.append(v)
+            else:
+                stack.append((middle, v))
+                stack.append((u, middle))
+        return result
+
+    def save(self, path):
+        data = {'rank': self.rank, 'upward': self.upward,
+                'downward': self.downward, 'shortcuts': self.shortcuts}
+        with open(path, 'wb') as file:
+            pickle.dump(data, file, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'rb') as file:
+            data = pickle.load(file)
+        hierarchy = cls()
+        hierarchy.rank = data['rank']
+        hierarchy.upward = data['upward']
+        hierarchy.downward = data['downward']
+        hierarchy.shortcuts = data['shortcuts']
+        return hierarchy
+
+
+if __name__ == "__main__":
+    hierarchy = ContractionHierarchy(my_graph)
+    print(f'Contraction order: {sorted(hierarchy.rank, key=hierarchy.rank.get)}')
+    print(f'Shortcuts: {hierarchy.shortcuts}')
+    for start, target in [('A', 'F'), ('E', 'B'), ('F', 'E')]:
+        distance, path = hierarchy.query(start, target)
+        expected = shortest_path(my_graph, start, target)[0][target]
+        print(f'\n{start}-{target} distance: {distance} (Dijkstra: {expected})\nPath: {" -> ".join(path)}')
@@ -1,3 +1,6 @@
+import heapq
+import math
+
 my_graph = {
     'A': [('B', 5), ('C', 3), ('E', 11)],
     'B': [('A', 5), ('C', 1), ('F', 2)],
@@ -8,31 +11,150 @@ my_graph = {
 }
 
 
+def dijkstra(graph, start, target=None):
+    distances = {start: 0}
+    predecessors = {start: None}
+    settled = set()
+    queue = [(0, start)]
+
+    while queue:
+        distance, current = heapq.heappop(queue)
+        if current in settled:
+            continue
+        settled.add(current)
+        if current == target:
+            break
+        for node, weight in graph.get(current, ()):
+            new_distance = distance + weight
+            if new_distance < distances.get(node, float('inf')):
+                distances[node] = new_distance
+                predecessors[node] = current
+                heapq.heappush(queue, (new_distance, node))
+
+    return distances, predecessors
+
+
+def build_path(predecessors, target):
+    if target not in predecessors:
+        return []
+    path = []
+    while target is not None:
+        path.append(target)
+        target = predecessors[target]
+    return path[::-1]
+
+
 def shortest_path(graph, start, target=''):
-    unvisited = list(graph)
-    distances = {node: 0 if node == start else float('inf') for node in graph}
-    paths = {node: [] for node in graph}
-    paths[start].append(start)
-
-    while unvisited:
-        current = min(unvisited, key=distances.get)
-        for node, distance in graph[current]:
-            if distance + distances[current] < distances[node]:
-                distances[node] = distance + distances[current]
-                if paths[node] and paths[node][-1] == node:
-                    paths[node] = paths[current][:]
-                else:
-                    paths[node].extend(paths[current])
-                paths[node].append(node)
-        unvisited.remove(current)
-
-    targets_to_print = [target] if target else graph
-    for node in targets_to_print:
+    # With a target the search stops as soon as the target is settled
+    distances, predecessors = dijkstra(graph, start, target or None)
+    targets = [target] if target else graph
+    paths = {node: build_path(predecessors, node) for node in targets}
+    distances = {node: distances.get(node, float('inf')) for node in targets}
+    return distances, paths
+
+
+def astar(graph, start, target, heuristic=None):
+    # heuristic(node, target) must never overestimate the remaining distance;
+    # without it this is Dijkstra stopped at the target. A node is expanded
+    # again when a shorter path to it turns up, so an admissible but
+    # inconsistent heuristic still gives the shortest distance
+    distances = {start: 0}
+    predecessors = {start: None}
+    expanded = 0
+    queue = [(heuristic(start, target) if heuristic else 0, 0, start)]
+
+    while queue:
+        _, distance, current = heapq.heappop(queue)
+        if distance > distances[current]:
+            continue
+        expanded += 1
+        if current == target:
+            return distance, build_path(predecessors, target), expanded
+        for node, weight in graph.get(current, ()):
+            new_distance = distance + weight
+            if new_distance < distances.get(node, float('inf')):
+                distances[node] = new_distance
+                predecessors[node] = current
+                estimate = new_distance + (heuristic(node, target) if heuristic else 0)
+                heapq.heappush(queue, (estimate, new_distance, node))
+
+    return float('inf'), [], expanded
+
+
+def point_to_point(graph, start, target):
+    return astar(graph, start, target)
+
+
+def euclidean_heuristic(coordinates):
+    # Admissible when no edge is shorter than the straight line between its ends
+    def heuristic(node, target):
+        (x1, y1), (x2, y2) = coordinates[node], coordinates[target]
+        return math.hypot(x2 - x1, y2 - y1)
+    return heuristic
+
+
+def reverse_graph(graph):
+    reversed_graph = {node: [] for node in graph}
+    for node, edges in graph.items():
+        for neighbour, weight in edges:
+            reversed_graph.setdefault(neighbour, []).append((node, weight))
+    return reversed_graph
+
+
+def bidirectional_dijkstra(graph, start, target, reversed_graph=None):
+    if start == target:
+        return 0, [start], 1
+    if reversed_graph is None:
+        reversed_graph = reverse_graph(graph)
+
+    graphs = (graph, reversed_graph)
+    distances = ({start: 0}, {target: 0})
+    predecessors = ({start: None}, {target: None})
+    settled = (set(), set())
+    queues = ([(0, start)], [(0, target)])
+    best, meeting = float('inf'), None
+
+    while queues[0] and queues[1]:
+        # Stop once no path through unsettled nodes can beat the best one
+        if queues[0][0][0] + queues[1][0][0] >= best:
+            break
+        side = 0 if queues[0][0][0] <= queues[1][0][0] else 1
+        distance, current = heapq.heappop(queues[side])
+        if current in settled[side]:
+            continue
+        settled[side].add(current)
+        for node, weight in graphs[side].get(current, ()):
+            new_distance = distance + weight
+            if new_distance < distances[side].get(node, float('inf')):
+                distances[side][node] = new_distance
+                predecessors[side][node] = current
+                heapq.heappush(queues[side], (new_distance, node))
+            if node in distances[1 - side]:
+                total = distances[side][node] + distances[1 - side][node]
+                if total < best:
+                    best, meeting = total, node
+
+    settled_count = len(settled[0]) + len(settled[1])
+    if meeting is None:
+        return float('inf'), [], settled_count
+    forward = build_path(predecessors[0], meeting)
+    backward = build_path(predecessors[1], meeting)[::-1]
+    return best, forward + backward[1:], settled_count
+
+
+def print_shortest_paths(graph, start, target=''):
+    distances, paths = shortest_path(graph, start, target)
+    for node in paths:
         if node == start:
             continue
         print(f'\n{start}-{node} distance: {distances[node]}\nPath: {" -> ".join(paths[node])}')
-
     return distances, paths
 
 
-shortest_path(my_graph, 'A', 'F')
\ No newline at end of file
+if __name__ == "__main__":
+    print_shortest_paths(my_graph, 'A', 'F')
+
+    for name, query in [('Dijkstra (point-to-point)', point_to_point),
+                        ('Bidirectional Dijkstra', bidirectional_dijkstra)]:
+        distance, path, settled = query(my_graph, 'A', 'F')
+        print(f'\n{name}: distance {distance}, path {" -> ".join(path)}, settled {settled}')